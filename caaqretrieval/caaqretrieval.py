@@ -1,11 +1,16 @@
 from __future__ import annotations
 import warnings
+
 import numpy as np
 import pandas as pd
-import requests
-import sentinel
 from requests.models import Response
 
+from nwisretrieval.exceptions import NWISEmptyResponse
+from nwisretrieval.inherit import cached_property_readonly
+from nwisretrieval.nwis import NWIS_URL_TEMPLATES, expected_index, is_complete, parse_nwis_records, query_url
+from nwisretrieval.sentinels import Unknown
+from nwisretrieval.session import decode_json
+
 
 class CAAQFrame(pd.DataFrame):
     """Inherits from pandas DataFrame to extend properties and methods specific to CAAQ time-series data.
@@ -14,6 +19,7 @@ class CAAQFrame(pd.DataFrame):
     ----------
     pd.DataFrame : pd.DataFrame
         pd.DataFrame to inherit from.
+        The data is not copied unless copy=True is passed.
 
     Returns
     -------
@@ -53,11 +59,17 @@ class CAAQFrame(pd.DataFrame):
     _metadata = ["_metadict"]
 
     # Custom sentinel object, works like "None"
-    Unknown = sentinel.create("Unknown")
+    Unknown = Unknown
 
+    # True only for frames built by get_caaq, whose columns are not shared with any other
+    # DataFrame.  resolve_masks only writes into the value buffer in place when this is set.
+    _owns_values = False
+
+    # Wrapping an existing DataFrame shares its data, pass copy=True to get an independent copy.
+    # The column container is always new, so assigning a column never reaches the wrapped DataFrame.
     def __init__(self, data: pd.DataFrame, *args, **kwargs):
-        if kwargs.get("copy") is None and isinstance(data, pd.DataFrame):
-            kwargs.update(copy=True)
+        if isinstance(data, pd.DataFrame):
+            data = data.copy(deep=False)
         super().__init__(data, *args, **kwargs)
         self._metadict = create_metadict()
 
@@ -138,12 +150,10 @@ class CAAQFrame(pd.DataFrame):
         Notes
         -----
         Currently only checking for Ice qualifiers.  May need to add more for equipment malfunctions, etc.
+        Reads the cached _qual_cache set, see invalidate().
         """
-        mask = ~self["qualifiers"].isnull()
-        unique_quals = list(pd.unique(self["qualifiers"][mask].apply(frozenset)))
-        for qual in unique_quals:
-            if "Ice" in qual or "i" in qual:
-                return "Ice"
+        if self._qual_cache & {"Ice", "i"}:
+            return "Ice"
         return self.Unknown
 
     def check_gaps(
@@ -179,16 +189,20 @@ class CAAQFrame(pd.DataFrame):
         if gap_tol == CAAQFrame.Unknown:
             warnings.warn(f"\nWarning: No gap tolerance specified for {self.staid}.", stacklevel=2)
             return CAAQFrame.Unknown
+        if is_complete(self.index, self.start_date, self.end_date, gap_tol):
+            return False
         gap_index = self.gap_index(gap_tol).to_frame()
         if gap_index.index.empty:
             return False
         if start_date and end_date:
             if gap_index[start_date:end_date].empty:
                 return False
-            # This section is kinda getto, need to work on formatting warning message of missing dates.
-            warnings.warn(f"\nGaps detected at: {self.staid} with a tolerance of {gap_tol} on:", stacklevel=2)
-            for missing_val in gap_index[start_date:end_date].index.array:
-                print(missing_val)
+            missing = gap_index[start_date:end_date].index.to_numpy()
+            missing_dates = "\n".join(np.datetime_as_string(missing, unit="s"))
+            warnings.warn(
+                f"\nGaps detected at: {self.staid} with a tolerance of {gap_tol} on:\n{missing_dates}",
+                stacklevel=2,
+            )
             return True
         warnings.warn(f"Gaps detected at: {self.staid} with a tolerance of {gap_tol}", stacklevel=2)
         return True
@@ -210,8 +224,13 @@ class CAAQFrame(pd.DataFrame):
             Index of missing dates in the time-series data.
         """
         gap_tol = self._resolve_gaptolerance(gap_tol)
-        idx = pd.date_range(self.start_date, self.end_date, freq=gap_tol)
-        return idx.difference(self.index)
+        expected = expected_index(self.start_date, self.end_date, gap_tol)
+        # Complete series, equals bails out on a length mismatch before comparing values.
+        if self.index.equals(expected):
+            return expected[:0]
+        # Both indexes are sorted datetimes, diff their int64 nanoseconds instead of Timestamps.
+        missing = np.setdiff1d(expected.asi8, self.index.asi8, assume_unique=self.index.is_unique)
+        return pd.DatetimeIndex(missing.view("datetime64[ns]"))
 
     def fill_gaps(
         self,
@@ -231,19 +250,17 @@ class CAAQFrame(pd.DataFrame):
         """
         gap_tol = self._resolve_gaptolerance(gap_tol)
         try:
-            self = (
-                self.reindex(pd.date_range(self.start_date, self.end_date, freq=gap_tol))
+            filled = (
+                self.reindex(expected_index(self.start_date, self.end_date, gap_tol))
                 .rename_axis(['dateTime'])
                 .fillna(float('NaN'))
             )
-            # self = self.asfreq(freq=gap_tol)
-            self._metadict["_gap_tolerance"] = gap_tol
-            # self["qualifiers"][self["qualifiers"].isnull()] = NWISFrame.Unknown
-            # self["qualifier_set"] = self["qualifiers"].map(set)
-            return self
         except ValueError:
             warnings.warn(f"No gap tolerance specified for {self.staid}.", stacklevel=2)
             return self
+        # reindex shares _metadict with self, give the filled frame its own.
+        filled._metadict = {**self._metadict, "_gap_tolerance": gap_tol}
+        return filled
 
     def check_approval(self) -> str:
         """Checks approval level of data.
@@ -260,16 +277,41 @@ class CAAQFrame(pd.DataFrame):
 
         Notes
         -----
+        Reads the cached _qual_cache set, see invalidate().
         """
-        mask = ~self["qualifiers"].isnull()
-        unique_quals = list(pd.unique(self["qualifiers"][mask].apply(frozenset)))
-        approval_level = next(
-            ("Provisional" for approval in unique_quals if "P" in approval),
-            "Approved",
-        )
+        approval_level = "Provisional" if "P" in self._qual_cache else "Approved"
         self._metadict["_approval"] = approval_level
         return approval_level
 
+    def invalidate(self) -> None:
+        """Clear the cached qualifier set used by check_approval and check_quals.
+        Call after modifying the "qualifiers" column.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.__dict__.pop("_qual_cache", None)
+        return None
+
+    @cached_property_readonly
+    def _qual_cache(self) -> frozenset:
+        """Every distinct qualifier code applied to the data, computed once per frame.
+        Categorical qualifiers (see process_caaq_response) are read from the categories in use,
+        anything else is one set union over the qualifier lists.
+        Cached on the instance, not in _metadict, which is shared with derived frames.
+        """
+        qualifiers = self["qualifiers"]
+        if isinstance(qualifiers.dtype, pd.CategoricalDtype):
+            codes = pd.unique(qualifiers.cat.codes.to_numpy())
+            categories = qualifiers.cat.categories.to_numpy()[codes[codes >= 0]]
+            return frozenset().union(*(category.split(",") for category in categories))
+        return frozenset().union(*qualifiers.dropna().to_numpy())
+
     def resolve_masks(self) -> None:
         """Convert any values from -999999 to NaN values.
         Set True to resolve NWIS masking of Ice qualified data to NaN values.
@@ -285,7 +327,13 @@ class CAAQFrame(pd.DataFrame):
         None
         """
 
-        self["value"] = self["value"].where(self["value"] != -999999.0, np.NaN)
+        values = self["value"].to_numpy(copy=False)
+        if self._owns_values and values.dtype.kind == "f":
+            # Write NaN straight into the float column, no new Series needed.
+            np.putmask(values, values == -999999.0, np.nan)
+        else:
+            # The column may be shared with the DataFrame this frame wraps or was sliced from.
+            self["value"] = self["value"].where(self["value"] != -999999.0, np.NaN)
         return None
 
     def _resolve_gaptolerance(
@@ -302,33 +350,6 @@ class CAAQFrame(pd.DataFrame):
         return gap_tol
 
 
-def query_url(
-    url: str,
-) -> Response:
-    """Qurey NWIS url with requests package.
-
-    Parameters
-    ----------
-    url : str
-        NWIS url pointing to JSON data
-
-    Returns
-    -------
-    Response
-        requests Response object
-
-    Raises
-    ------
-    SystemExit
-        If status code is not 200, some error has occured and no data was returned, exit the program.
-    """
-    response = requests.get(url)
-    if response.status_code != 200:
-        print(f"Critical error!  No data found at: {url}\n Reason: {response.reason}")
-        raise SystemExit
-    return response
-
-
 def create_metadict(
     rdata: dict | None = None,
     **kwargs,
@@ -361,22 +382,20 @@ def create_metadict(
         "resolve_masking"
         "_approval"
     """
-    metadict = dict(
-        {
-            "_staid": kwargs.get("staid", CAAQFrame.Unknown),
-            "_start_date": kwargs.get("start_date", CAAQFrame.Unknown),
-            "_end_date": kwargs.get("end_date", CAAQFrame.Unknown),
-            "_param": kwargs.get("param", CAAQFrame.Unknown),
-            "_stat_code": kwargs.get("stat_code", CAAQFrame.Unknown),
-            "_service": kwargs.get("service", CAAQFrame.Unknown),
-            "_access_level": kwargs.get("access", CAAQFrame.Unknown),
-            "_url": kwargs.get("url", CAAQFrame.Unknown),
-            "_gap_tolerance": kwargs.get("gap_tol", CAAQFrame.Unknown),
-            "_gap_fill": kwargs.get("gap_fill", CAAQFrame.Unknown),
-            "_resolve_masking": kwargs.get("resolve_masking", CAAQFrame.Unknown),
-            "_approval": kwargs.get("_approval", CAAQFrame.Unknown),
-        }
-    )
+    metadict = {
+        "_staid": kwargs.get("staid", CAAQFrame.Unknown),
+        "_start_date": kwargs.get("start_date", CAAQFrame.Unknown),
+        "_end_date": kwargs.get("end_date", CAAQFrame.Unknown),
+        "_param": kwargs.get("param", CAAQFrame.Unknown),
+        "_stat_code": kwargs.get("stat_code", CAAQFrame.Unknown),
+        "_service": kwargs.get("service", CAAQFrame.Unknown),
+        "_access_level": kwargs.get("access", CAAQFrame.Unknown),
+        "_url": kwargs.get("url", CAAQFrame.Unknown),
+        "_gap_tolerance": kwargs.get("gap_tol", CAAQFrame.Unknown),
+        "_gap_fill": kwargs.get("gap_fill", CAAQFrame.Unknown),
+        "_resolve_masking": kwargs.get("resolve_masking", CAAQFrame.Unknown),
+        "_approval": kwargs.get("_approval", CAAQFrame.Unknown),
+    }
     if rdata:
         metadict.update(
             {
@@ -412,21 +431,17 @@ def process_caaq_response(
     pd.DataFrame
         Columns: values, approval/qualifiers
         Index: DateTimeIndex
+        Values are float32, cast with .astype("float64") if more precision is needed downstream.
+        Qualifiers are categorical, each category is a comma separated qualifier list e.g. "P,Ice".
 
     Raises
     ------
-    SystemExit
-        If DataFrame returned from NWIS is empty, exit the program.
-        Why continue if there's no data?
+    NWISEmptyResponse
+        If the NWIS response holds no time-series data.
     """
-    dataframe = pd.json_normalize(rdata, ["value", "timeSeries", "values", "value"])
-    if dataframe.empty is True:
-        print(f"Critical error!  Response status code: {response.status_code}\n No data found at: {url}")
-        raise SystemExit
-    dataframe["dateTime"] = pd.to_datetime(dataframe["dateTime"].array, infer_datetime_format=True)
-    dataframe.set_index("dateTime", inplace=True)
-    dataframe = dataframe.tz_localize(None)
-    dataframe["value"] = pd.to_numeric(dataframe["value"])
+    dataframe = parse_nwis_records(rdata)
+    if dataframe.empty:
+        raise NWISEmptyResponse(f"Response status code: {response.status_code}\n No data found at: {url}")
     return dataframe
 
 
@@ -443,7 +458,7 @@ def build_url(
 
     Parameters
     ----------
-    STAID : str | int
+    staid : str | int
         NWIS station ID
     start_date : str
         Start date of data pull range.
@@ -462,12 +477,23 @@ def build_url(
     -------
     str
         URL of data to query from NWIS.
+
+    Raises
+    ------
+    ValueError
+        If service is not "iv" or "dv".
     """
-    service_urls = {
-        "dv": f"https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites={staid}&startDT={start_date}&endDT={end_date}&statCd={stat_code}&parameterCd={param}&siteStatus=all&access={access}",
-        "iv": f"https://nwis.waterservices.usgs.gov/nwis/iv/?format=json&sites={staid}&parameterCd={param}&startDT={start_date}&endDT={end_date}&siteStatus=all&access={access}",
-    }
-    return service_urls[service]
+    if service not in NWIS_URL_TEMPLATES:
+        raise ValueError(f"service must be one of {list(NWIS_URL_TEMPLATES)}, got {service!r}")
+    # Only the requested service's template is formatted.
+    return NWIS_URL_TEMPLATES[service].format(
+        STAID=staid,
+        start_date=start_date,
+        end_date=end_date,
+        param=param,
+        stat_code=stat_code,
+        access=access,
+    )
 
 
 def get_caaq(
@@ -487,7 +513,7 @@ def get_caaq(
 
     Parameters
     ----------
-    STAID : str
+    staid : str
         Station description
     start_date : str
         Start date
@@ -530,13 +556,14 @@ def get_caaq(
         access=access,
     )
     response = query_url(url)
-    rdata = response.json()
+    rdata = decode_json(response)
     dataframe = process_caaq_response(url, response, rdata)
 
     dataframe = CAAQFrame(dataframe)
+    dataframe._owns_values = True
     dataframe._metadict = create_metadict(
         dataframe=dataframe,
-        STAID=staid,
+        staid=staid,
         start_date=start_date,
         end_date=end_date,
         param=param,
@@ -550,13 +577,17 @@ def get_caaq(
         rdata=rdata,
     )
 
-    if gap_fill and bool(gap_tol):
+    gaps_filled = gap_fill and bool(gap_tol)
+    if gaps_filled:
         dataframe = dataframe.fill_gaps(gap_tol)
+        # Nothing else holds the parsed columns the filled frame was built from.
+        dataframe._owns_values = True
     if resolve_masking:
         dataframe.resolve_masks()
-    dataframe.check_quals()
-    dataframe.check_approval()
-    dataframe.check_gaps(gap_tol=gap_tol)
+    # Qualifiers and approval are only scanned when the qualifier/approval properties are read.
+    # A filled series has no gaps at gap_tol, only check unfilled data.
+    if not gaps_filled:
+        dataframe.check_gaps(gap_tol=gap_tol)
     return dataframe
 
 
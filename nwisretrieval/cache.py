@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+
+# Where NWIS responses are cached, override with the NWISRETRIEVAL_CACHE_DIR environment variable.
+CACHE_DIR = Path(os.environ.get("NWISRETRIEVAL_CACHE_DIR", Path.home() / ".cache" / "nwisretrieval"))
+
+# Most recently used parsed results kept in memory, see memory_get and memory_put.
+MEMORY_CACHE_SIZE = 32
+_memory_cache: OrderedDict = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def cache_path(
+    url: str,
+    cache_dir: Path | None = None,
+) -> Path:
+    """Path of the cache file for url.
+
+    Parameters
+    ----------
+    url : str
+        Query url, the cache key.
+    cache_dir : Path | None, optional
+        Directory holding the cache, by default CACHE_DIR
+
+    Returns
+    -------
+    Path
+        Gzipped cache file named by the SHA-1 of url.
+    """
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return Path(cache_dir or CACHE_DIR) / f"{key}.json.gz"
+
+
+def read_cache(
+    url: str,
+    ttl: float,
+    cache_dir: Path | None = None,
+) -> bytes | None:
+    """Read the cached response body for url.
+
+    Parameters
+    ----------
+    url : str
+        Query url, the cache key.
+    ttl : float
+        Seconds a cached response stays valid.
+    cache_dir : Path | None, optional
+        Directory holding the cache, by default CACHE_DIR
+
+    Returns
+    -------
+    bytes | None
+        Cached response body, None if there is no cached response or it is older than ttl.
+    """
+    path = cache_path(url, cache_dir)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        with gzip.open(path, "rb") as file:
+            return file.read()
+    except (OSError, EOFError):
+        # Missing, unreadable or half written files are cache misses, query NWIS again.
+        return None
+
+
+def write_cache(
+    url: str,
+    content: bytes,
+    cache_dir: Path | None = None,
+) -> None:
+    """Cache the response body for url.
+    Written to a temporary file first and moved into place, so concurrent
+    readers never see a partial file.
+
+    Parameters
+    ----------
+    url : str
+        Query url, the cache key.
+    content : bytes
+        Response body to cache.
+    cache_dir : Path | None, optional
+        Directory holding the cache, by default CACHE_DIR
+
+    Returns
+    -------
+    None
+    """
+    path = cache_path(url, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(gzip.compress(content, compresslevel=1))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return None
+
+
+def delete_cache(
+    url: str,
+    cache_dir: Path | None = None,
+) -> None:
+    """Delete the cached response body for url, if there is one.
+
+    Parameters
+    ----------
+    url : str
+        Query url, the cache key.
+    cache_dir : Path | None, optional
+        Directory holding the cache, by default CACHE_DIR
+
+    Returns
+    -------
+    None
+    """
+    cache_path(url, cache_dir).unlink(missing_ok=True)
+    return None
+
+
+def memory_get(
+    key: Hashable,
+    ttl: float,
+) -> object | None:
+    """Look up a result cached in memory by memory_put.
+
+    Parameters
+    ----------
+    key : Hashable
+        Cache key, e.g. the query url and build options.
+    ttl : float
+        Seconds a cached result stays valid.
+
+    Returns
+    -------
+    object | None
+        Cached result, None if there is none or it is older than ttl.
+    """
+    with _memory_lock:
+        entry = _memory_cache.get(key)
+        if entry is None or time.time() - entry[0] >= ttl:
+            return None
+        _memory_cache.move_to_end(key)
+        return entry[1]
+
+
+def memory_put(
+    key: Hashable,
+    value: object,
+) -> None:
+    """Cache a result in memory, evicting the least recently used beyond MEMORY_CACHE_SIZE.
+
+    Parameters
+    ----------
+    key : Hashable
+        Cache key, e.g. the query url and build options.
+    value : object
+        Result to cache.  Callers are responsible for not mutating it afterwards.
+
+    Returns
+    -------
+    None
+    """
+    with _memory_lock:
+        _memory_cache[key] = (time.time(), value)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+    return None
+
+
+def clear_cache(
+    disk: bool = False,
+    cache_dir: Path | None = None,
+) -> None:
+    """Empty the in-memory cache, and the on-disk cache if disk=True.
+
+    Parameters
+    ----------
+    disk : bool, optional
+        Also delete the cached responses on disk, by default False
+    cache_dir : Path | None, optional
+        Directory holding the on-disk cache, by default CACHE_DIR
+
+    Returns
+    -------
+    None
+    """
+    with _memory_lock:
+        _memory_cache.clear()
+    if disk:
+        for path in Path(cache_dir or CACHE_DIR).glob("*.json.gz"):
+            path.unlink(missing_ok=True)
+    return None
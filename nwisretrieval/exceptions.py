@@ -0,0 +1,32 @@
+class NWISError(Exception):
+    """Base class for every error raised by nwisretrieval.
+    Catch it to skip or retry a station without stopping the rest of a batch pull.
+    """
+
+
+class NWISRetrievalError(NWISError, RuntimeError):
+    """Raised when data could not be retrieved from NWIS."""
+
+
+class NWISHTTPError(NWISRetrievalError):
+    """Raised when NWIS answers a query with an HTTP error status.
+
+    Parameters
+    ----------
+    message : str
+        Error message.
+    status_code : int
+        HTTP status code of the NWIS response.
+    """
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class NWISNotFoundError(NWISHTTPError):
+    """Raised when NWIS has nothing at the queried url (HTTP 404)."""
+
+
+class NWISEmptyResponse(NWISRetrievalError):
+    """Raised when an NWIS query succeeds but returns no time-series data."""
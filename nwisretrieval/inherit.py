@@ -1,12 +1,43 @@
 from __future__ import annotations
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
 import numpy as np
 import pandas as pd
 import requests
-import sentinel
-from requests.models import Response
+
+from nwisretrieval.cache import delete_cache, memory_get, memory_put, read_cache, write_cache
+from nwisretrieval.exceptions import NWISEmptyResponse, NWISError
+from nwisretrieval.nwis import NWIS_URL_TEMPLATES, expected_index, is_complete, parse_nwis_records, query_url
+from nwisretrieval.sentinels import Unknown
+from nwisretrieval.session import decode_json, loads
+
+# get_nwis kwargs that make up the query url, see build_url.
+URL_KWARGS = ("STAID", "start_date", "end_date", "param", "stat_code", "service", "access")
+# get_nwis kwargs accepted per query by get_nwis_many, session is shared by every query.
+QUERY_KWARGS = (*URL_KWARGS, "gap_tol", "gap_fill", "resolve_masking", "cache_ttl")
+
+
+class cached_property_readonly(cached_property):
+    """functools.cached_property that cannot be assigned to.
+
+    The value is cached on the instance itself rather than in _metadict.  _metadict is
+    handed by reference to every frame derived from this one (slices, reindex, etc.),
+    so caching there would leak one frame's result into another.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        if self.attrname not in cache:
+            cache[self.attrname] = self.func(instance)
+        return cache[self.attrname]
+
+    def __set__(self, instance, value):
+        raise AttributeError(f"can't set attribute '{self.attrname}'")
 
 
 class NWISFrame(pd.DataFrame):
@@ -17,6 +48,7 @@ class NWISFrame(pd.DataFrame):
     ----------
     pd.DataFrame : pd.DataFrame
         pd.DataFrame to inherit from.
+        The data is not copied unless copy=True is passed.
 
     Returns
     -------
@@ -57,11 +89,17 @@ class NWISFrame(pd.DataFrame):
     _metadata = ["_metadict"]
 
     # Custom sentinel object, works like "None"
-    Unknown = sentinel.create("Unknown")
+    Unknown = Unknown
+
+    # True only for frames built by build_nwisframe, whose columns are not shared with any other
+    # DataFrame.  resolve_masks only writes into the value buffer in place when this is set.
+    _owns_values = False
 
+    # Wrapping an existing DataFrame shares its data, pass copy=True to get an independent copy.
+    # The column container is always new, so assigning a column never reaches the wrapped DataFrame.
     def __init__(self, data: pd.DataFrame, *args, **kwargs):
-        if kwargs.get("copy") is None and isinstance(data, pd.DataFrame):
-            kwargs.update(copy=True)
+        if isinstance(data, pd.DataFrame):
+            data = data.copy(deep=False)
         super().__init__(data, *args, **kwargs)
         self._metadict = create_metadict()
 
@@ -71,43 +109,58 @@ class NWISFrame(pd.DataFrame):
     def _constructor(self):
         return NWISFrame
 
-    @property
+    # Metadata is fixed once _metadict is populated, these are computed once per frame.
+    # gap_tolerance stays a plain property, fill_gaps and _resolve_gaptolerance update it.
+    _cached_metadata = (
+        "STAID",
+        "start_date",
+        "end_date",
+        "param",
+        "stat_code",
+        "service",
+        "url",
+        "site_name",
+        "coords",
+        "var_description",
+    )
+
+    @cached_property_readonly
     def STAID(self):
         return self._metadict.get("_STAID")
 
-    @property
+    @cached_property_readonly
     def start_date(self):
         return str(self._metadict.get("_start_date"))
 
-    @property
+    @cached_property_readonly
     def end_date(self):
         return str(self._metadict.get("_end_date"))
 
-    @property
+    @cached_property_readonly
     def param(self):
         return self._metadict.get("_param")
 
-    @property
+    @cached_property_readonly
     def stat_code(self):
         return self._metadict.get("_stat_code")
 
-    @property
+    @cached_property_readonly
     def service(self):
         return self._metadict.get("_service")
 
-    @property
+    @cached_property_readonly
     def url(self):
         return self._metadict.get("_url")
 
-    @property
+    @cached_property_readonly
     def site_name(self):
         return self._metadict.get("_site_name")
 
-    @property
+    @cached_property_readonly
     def coords(self):
         return self._metadict.get("_coords")
 
-    @property
+    @cached_property_readonly
     def var_description(self):
         return self._metadict.get("_var_description")
 
@@ -143,12 +196,10 @@ class NWISFrame(pd.DataFrame):
         -----
         Currently only checking for Ice qualifiers.
         May need to add more for equipment malfunctions, etc.
+        Reads the cached _qual_cache set, see invalidate().
         """
-        mask = ~self["qualifiers"].isnull()
-        unique_quals = list(pd.unique(self["qualifiers"][mask].apply(frozenset)))
-        for qual in unique_quals:
-            if "Ice" in qual or "i" in qual:
-                return "Ice"
+        if self._qual_cache & {"Ice", "i"}:
+            return "Ice"
         return self.Unknown
 
     def check_gaps(
@@ -186,19 +237,20 @@ class NWISFrame(pd.DataFrame):
         if gap_tol == NWISFrame.Unknown:
             warnings.warn(f"\nNo gap tolerance specified for {self.STAID}.", stacklevel=2)
             return NWISFrame.Unknown
+        if self._is_complete(gap_tol):
+            return False
         gap_index = self.gap_index(gap_tol).to_frame()
         if gap_index.index.empty:
             return False
         if start_date and end_date:
             if gap_index[start_date:end_date].empty:
                 return False
-            # This section is kinda getto, need to work on formatting warning message of missing dates.
+            missing = gap_index[start_date:end_date].index.to_numpy()
+            missing_dates = "\n".join(np.datetime_as_string(missing, unit="s"))
             warnings.warn(
-                f"\nGaps detected at: {self.STAID} with a tolerance of {gap_tol} on:",
+                f"\nGaps detected at: {self.STAID} with a tolerance of {gap_tol} on:\n{missing_dates}",
                 stacklevel=2,
             )
-            for missing_val in gap_index[start_date:end_date].index.array:
-                print(missing_val)
             return True
         warnings.warn(
             f"Gaps detected at: {self.STAID} with a tolerance of {gap_tol}",
@@ -223,8 +275,10 @@ class NWISFrame(pd.DataFrame):
             Index of missing dates in the time-series data.
         """
         gap_tol = self._resolve_gaptolerance(gap_tol)
-        idx = pd.date_range(self.start_date, self.end_date, freq=gap_tol)
-        return idx.difference(self.index)
+        expected = self._expected_index(gap_tol)
+        # Both indexes are sorted datetimes, diff their int64 nanoseconds instead of Timestamps.
+        missing = np.setdiff1d(expected.asi8, self.index.asi8, assume_unique=self.index.is_unique)
+        return pd.DatetimeIndex(missing.view("datetime64[ns]"))
 
     def fill_gaps(
         self,
@@ -240,19 +294,25 @@ class NWISFrame(pd.DataFrame):
         Returns
         -------
         NWISFrame
-            Return new instance of NWISFrame with gaps filled by NaN values
+            Return new instance of NWISFrame with gaps filled by NaN values.
+            A shallow copy sharing the data when there are no gaps to fill.
         """
         gap_tol = self._resolve_gaptolerance(gap_tol)
+        if self._is_complete(gap_tol) and self.index.is_monotonic_increasing:
+            # Already exactly the start/end range at gap_tol, nothing to fill.
+            filled = self.copy(deep=False)
+            filled._metadict = {**self._metadict, "_gap_tolerance": gap_tol}
+            return filled
         try:
-            self = self.reindex(pd.date_range(self.start_date, self.end_date, freq=gap_tol)).rename_axis(["dateTime"]).fillna(float("NaN"))
-            # self = self.asfreq(freq=gap_tol)
-            self._metadict["_gap_tolerance"] = gap_tol
-            # self["qualifiers"][self["qualifiers"].isnull()] = NWISFrame.Unknown
-            # self["qualifier_set"] = self["qualifiers"].map(set)
-            return self
+            # A single reindex onto the full start/end range, missing rows come back as NaN.
+            filled = self.reindex(self._expected_index(gap_tol))
         except ValueError:
             warnings.warn(f"No gap tolerance specified for {self.STAID}.", stacklevel=2)
             return self
+        # reindex shares _metadict with self, give the filled frame its own.
+        filled._metadict = {**self._metadict, "_gap_tolerance": gap_tol}
+        filled.invalidate()
+        return filled
 
     def check_approval(self) -> str:
         """Checks approval level of data.
@@ -269,13 +329,9 @@ class NWISFrame(pd.DataFrame):
 
         Notes
         -----
+        Reads the cached _qual_cache set, see invalidate().
         """
-        mask = ~self["qualifiers"].isnull()
-        unique_quals = list(pd.unique(self["qualifiers"][mask].apply(frozenset)))
-        approval_level = next(
-            ("Provisional" for approval in unique_quals if "P" in approval),
-            "Approved",
-        )
+        approval_level = "Provisional" if "P" in self._qual_cache else "Approved"
         self._metadict["_approval"] = approval_level
         return approval_level
 
@@ -294,9 +350,70 @@ class NWISFrame(pd.DataFrame):
         None
         """
 
-        self["value"] = self["value"].where(self["value"] != -999999.0, np.NaN)
+        values = self["value"].to_numpy(copy=False)
+        if self._owns_values and values.dtype.kind == "f":
+            # Write NaN straight into the float column, no new Series needed.
+            np.putmask(values, values == -999999.0, np.nan)
+        else:
+            # The column may be shared with the DataFrame this frame wraps or was sliced from.
+            self["value"] = self["value"].where(self["value"] != -999999.0, np.NaN)
         return None
 
+    def invalidate(self) -> None:
+        """Clear the cached qualifier set used by check_approval and check_quals,
+        and the cached metadata properties.
+        Call after modifying the "qualifiers" column or replacing _metadict.
+        Only the instance caches are cleared, _metadict is shared with derived frames and left alone.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        for attrname in ("_qual_cache", *NWISFrame._cached_metadata):
+            self.__dict__.pop(attrname, None)
+        return None
+
+    @cached_property_readonly
+    def _qual_cache(self) -> frozenset:
+        """
+        Every distinct qualifier code applied to the data, computed once per frame.
+
+        Categorical qualifiers (see process_nwis_response) are read from the categories in use,
+        so the check is O(categories) rather than O(rows).  Anything else is one set union
+        over the qualifier lists.
+        """
+        qualifiers = self["qualifiers"]
+        if isinstance(qualifiers.dtype, pd.CategoricalDtype):
+            # Look up the codes in use directly, remove_unused_categories would recode every row.
+            codes = pd.unique(qualifiers.cat.codes.to_numpy())
+            categories = qualifiers.cat.categories.to_numpy()[codes[codes >= 0]]
+            return frozenset().union(*(category.split(",") for category in categories))
+        return frozenset().union(*qualifiers.dropna().to_numpy())
+
+    def _expected_index(
+        self,
+        gap_tol: str,
+    ) -> pd.DatetimeIndex:
+        """
+        Return the complete DatetimeIndex from start_date to end_date at a frequency of gap_tol.
+
+        Shared through the nwis.expected_index cache, frames covering the same period reuse one index.
+        """
+        return expected_index(self.start_date, self.end_date, gap_tol)
+
+    def _is_complete(
+        self,
+        gap_tol: str,
+    ) -> bool:
+        """
+        Cheap check that the index holds every expected timestamp, see nwis.is_complete.
+        """
+        return is_complete(self.index, self.start_date, self.end_date, gap_tol)
+
     def _resolve_gaptolerance(
         self,
         gap_tol: str | None,
@@ -311,32 +428,48 @@ class NWISFrame(pd.DataFrame):
         return gap_tol
 
 
-def query_url(
+def query_json(
     url: str,
-) -> Response:
-    """Qurey NWIS url with requests package.
+    session: requests.Session | None = None,
+    cache_ttl: float | None = None,
+) -> dict:
+    """Query NWIS url and decode the JSON response, optionally through the on-disk cache.
 
     Parameters
     ----------
     url : str
         NWIS url pointing to JSON data
+    session : requests.Session | None, optional
+        Session to query NWIS with, by default the shared module Session
+    cache_ttl : float | None, optional
+        Seconds a cached response for url is reused for before NWIS is queried again.
+        By default None, always query NWIS and cache nothing.
 
     Returns
     -------
-    Response
-        requests Response object
+    dict
+        Decoded JSON data.
 
     Raises
     ------
-    SystemExit
-        If status code is not 200, some error has occured and no data was
-        returned, exit the program.
+    NWISRetrievalError
+        If status code is not 200, some error has occured and no data was returned.
+        Also raised when the response body is not JSON.
     """
-    response = requests.get(url)
-    if response.status_code != 200:
-        print(f"Critical error!  No data found at: {url}\n Reason: {response.reason}")
-        raise SystemExit
-    return response
+    if cache_ttl:
+        content = read_cache(url, cache_ttl)
+        if content is not None:
+            try:
+                return loads(content)
+            except ValueError:
+                # Undecodable cache files are cache misses, drop it and query NWIS again.
+                delete_cache(url)
+    response = query_url(url, session=session)
+    # Only cache bodies that decode, e.g. a 200 maintenance page must not be served from the cache.
+    rdata = decode_json(response)
+    if cache_ttl:
+        write_cache(url, response.content)
+    return rdata
 
 
 def create_metadict(
@@ -358,7 +491,7 @@ def create_metadict(
     Notes
     -----
     Valid kwargs:
-        ""STAID"
+        "STAID"
         "start_date"
         "end_date"
         "param"
@@ -371,31 +504,34 @@ def create_metadict(
         "resolve_masking"
         "_approval"
     """
-    metadict = dict(
-        {
-            "_STAID": kwargs.get("STAID", NWISFrame.Unknown),
-            "_start_date": kwargs.get("start_date", NWISFrame.Unknown),
-            "_end_date": kwargs.get("end_date", NWISFrame.Unknown),
-            "_param": kwargs.get("param", NWISFrame.Unknown),
-            "_stat_code": kwargs.get("stat_code", NWISFrame.Unknown),
-            "_service": kwargs.get("service", NWISFrame.Unknown),
-            "_access_level": kwargs.get("access", NWISFrame.Unknown),
-            "_url": kwargs.get("url", NWISFrame.Unknown),
-            "_gap_tolerance": kwargs.get("gap_tol", NWISFrame.Unknown),
-            "_gap_fill": kwargs.get("gap_fill", NWISFrame.Unknown),
-            "_resolve_masking": kwargs.get("resolve_masking", NWISFrame.Unknown),
-            "_approval": kwargs.get("_approval", NWISFrame.Unknown),
-        }
-    )
+    get = kwargs.get
+    unknown = NWISFrame.Unknown
+    metadict = {
+        "_STAID": get("STAID", unknown),
+        "_start_date": get("start_date", unknown),
+        "_end_date": get("end_date", unknown),
+        "_param": get("param", unknown),
+        "_stat_code": get("stat_code", unknown),
+        "_service": get("service", unknown),
+        "_access_level": get("access", unknown),
+        "_url": get("url", unknown),
+        "_gap_tolerance": get("gap_tol", unknown),
+        "_gap_fill": get("gap_fill", unknown),
+        "_resolve_masking": get("resolve_masking", unknown),
+        "_approval": get("_approval", unknown),
+    }
     if rdata:
+        # The NWIS schema is fixed, index straight to the first time series.
+        time_series = rdata["value"]["timeSeries"][0]
+        geog_location = time_series["sourceInfo"]["geoLocation"]["geogLocation"]
         metadict.update(
             {
-                "_site_name": rdata["value"]["timeSeries"][0]["sourceInfo"]["siteName"] or NWISFrame.Unknown,
+                "_site_name": time_series["sourceInfo"]["siteName"] or unknown,
                 "_coords": (
-                    rdata["value"]["timeSeries"][0]["sourceInfo"]["geoLocation"]["geogLocation"]["latitude"] or NWISFrame.Unknown,
-                    rdata["value"]["timeSeries"][0]["sourceInfo"]["geoLocation"]["geogLocation"]["longitude"] or NWISFrame.Unknown,
+                    geog_location["latitude"] or unknown,
+                    geog_location["longitude"] or unknown,
                 ),
-                "_var_description": rdata["value"]["timeSeries"][0]["variable"]["variableDescription"] or NWISFrame.Unknown,
+                "_var_description": time_series["variable"]["variableDescription"] or unknown,
             }
         )
     return metadict
@@ -428,24 +564,16 @@ def process_nwis_response(
     pd.DataFrame
         Columns: values, approval/qualifiers
         Index: DateTimeIndex
-
-    Raises
-    ------
-    SystemExit
-        If DataFrame returned from NWIS is empty, exit the program.
-        Why continue if there's no data?
+        Values are float32, cast with .astype("float64") if more precision is needed downstream.
+        Qualifiers are categorical, each category is a comma separated qualifier list e.g. "P,Ice".
     """
-    if record_path is None:
-        record_path = ["value", "timeSeries", "values", "value"]
-    dataframe = pd.json_normalize(rdata, record_path=record_path)
-    dataframe[datetime_col] = pd.to_datetime(
-        dataframe[datetime_col].array,
-        infer_datetime_format=True,
+    return parse_nwis_records(
+        rdata,
+        record_path=record_path,
+        datetime_col=datetime_col,
+        value_col=value_col,
+        categorical=True,
     )
-    dataframe.set_index(datetime_col, inplace=True)
-    dataframe = dataframe.tz_localize(None)
-    dataframe[value_col] = pd.to_numeric(dataframe[value_col])
-    return dataframe
 
 
 def build_url(
@@ -453,9 +581,9 @@ def build_url(
     start_date: str,
     end_date: str,
     param: str,
-    stat_code: str,
-    service: str,
-    access: str | int,
+    stat_code: str = "00003",
+    service: str = "iv",
+    access: str | int = 0,
 ) -> str:
     """Generate URL to retrieve NWIS data from.
 
@@ -469,23 +597,34 @@ def build_url(
         End date of data pull range.
     param : str
         Parameter code, e.g. 00060
-    stat_code : str
-        Statistical code
-    service : str
-        "iv": instantanious data services, "dv": daily value service
-    access : str | int
-        NWIS access level.  0 - Public, 1 - Coop, 2 - Internal USGS
+    stat_code : str, optional
+        Statistical code, by default daily values "00003"
+    service : str, optional
+        "iv": instantanious data services, "dv": daily value service, by default "iv"
+    access : str | int, optional
+        NWIS access level.  0 - Public, 1 - Coop, 2 - Internal USGS, by default 0
 
     Returns
     -------
     str
         URL of data to query from NWIS.
+
+    Raises
+    ------
+    ValueError
+        If service is not "iv" or "dv".
     """
-    service_urls = {
-        "dv": f"https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites={STAID}&startDT={start_date}&endDT={end_date}&statCd={stat_code}&parameterCd={param}&siteStatus=all&access={access}",
-        "iv": f"https://nwis.waterservices.usgs.gov/nwis/iv/?format=json&sites={STAID}&parameterCd={param}&startDT={start_date}&endDT={end_date}&siteStatus=all&access={access}",
-    }
-    return service_urls[service]
+    if service not in NWIS_URL_TEMPLATES:
+        raise ValueError(f"service must be one of {list(NWIS_URL_TEMPLATES)}, got {service!r}")
+    # Only the requested service's template is formatted.
+    return NWIS_URL_TEMPLATES[service].format(
+        STAID=STAID,
+        start_date=start_date,
+        end_date=end_date,
+        param=param,
+        stat_code=stat_code,
+        access=access,
+    )
 
 
 def get_nwis(
@@ -499,6 +638,8 @@ def get_nwis(
     gap_tol: str | None = None,
     gap_fill: bool = False,
     resolve_masking: bool = False,
+    session: requests.Session | None = None,
+    cache_ttl: float | None = None,
 ) -> NWISFrame:
     """Retreives NWIS time-series data as a dataframe with
     extended methods and metadata properties.
@@ -530,6 +671,13 @@ def get_nwis(
         Data with qualifiers such as "Ice" will mask data values
         with -999999 when access level is public.
         Set True and -999999 will be converted to np.NaN values, by default False
+    session : requests.Session | None, optional
+        Session to query NWIS with, by default the shared module Session
+    cache_ttl : float | None, optional
+        Reuse a frame built by an identical get_nwis call in this process, or a response
+        cached on disk (nwisretrieval.cache.CACHE_DIR), if it is younger than cache_ttl
+        seconds, e.g. 86400 for provisional data or 604800 for approved data.
+        By default None, always query NWIS.  See nwisretrieval.cache.clear_cache.
 
     Returns
     -------
@@ -537,6 +685,13 @@ def get_nwis(
         Acts just like a pandas DataFrame, but comes with
         extended methods and properties.
 
+    Raises
+    ------
+    NWISRetrievalError
+        If the NWIS query fails.
+    NWISEmptyResponse
+        If the NWIS response holds no time-series data.
+
     Notes
     -----
     Refactor this function.  It handles too much.
@@ -551,14 +706,108 @@ def get_nwis(
         service=service,
         access=access,
     )
-    response = query_url(url)
-    rdata = response.json()
+    cache_key = _frame_cache_key(url, gap_tol=gap_tol, gap_fill=gap_fill, resolve_masking=resolve_masking)
+    if cache_ttl:
+        cached = memory_get(cache_key, cache_ttl)
+        if cached is not None:
+            return copy_nwisframe(cached)
+    # Only the decoded dict is kept, the raw body is released before the frame is built.
+    rdata = query_json(url, session=session, cache_ttl=cache_ttl)
+    nwisframe = build_nwisframe(
+        rdata,
+        url=url,
+        STAID=STAID,
+        start_date=start_date,
+        end_date=end_date,
+        param=param,
+        stat_code=stat_code,
+        service=service,
+        access=access,
+        gap_tol=gap_tol,
+        gap_fill=gap_fill,
+        resolve_masking=resolve_masking,
+    )
+    if cache_ttl:
+        memory_put(cache_key, copy_nwisframe(nwisframe))
+    return nwisframe
+
+
+def _frame_cache_key(
+    url: str,
+    gap_tol: str | None = None,
+    gap_fill: bool = False,
+    resolve_masking: bool = False,
+    **kwargs,
+) -> tuple:
+    """
+    In-memory cache key of a built NWISFrame, the query url plus the options that change the frame.
+    The remaining get_nwis kwargs are already part of url.
+    """
+    return (url, gap_tol, gap_fill, resolve_masking)
+
+
+def copy_nwisframe(
+    nwisframe: NWISFrame,
+) -> NWISFrame:
+    """Independent copy of an NWISFrame, data and metadata.
+    DataFrame.copy hands the copy the same _metadict, this gives it its own.
+
+    Parameters
+    ----------
+    nwisframe : NWISFrame
+        NWISFrame to copy.
+
+    Returns
+    -------
+    NWISFrame
+    """
+    copy = nwisframe.copy()
+    copy._metadict = dict(nwisframe._metadict)
+    copy._owns_values = True
+    return copy
+
+
+def build_nwisframe(
+    rdata: dict,
+    url: str,
+    STAID: str,
+    start_date: str,
+    end_date: str,
+    param: str,
+    stat_code: str = "00003",
+    service: str = "iv",
+    access: str | int = 0,
+    gap_tol: str | None = None,
+    gap_fill: bool = False,
+    resolve_masking: bool = False,
+) -> NWISFrame:
+    """Build an NWISFrame from NWIS JSON that has already been retrieved and decoded.
+    No network IO, see get_nwis for the query parameters.
+
+    Parameters
+    ----------
+    rdata : dict
+        Decoded JSON data from the NWIS query.
+    url : str
+        NWIS url rdata was retrieved from.
+
+    Returns
+    -------
+    NWISFrame
+        Acts just like a pandas DataFrame, but comes with
+        extended methods and properties.
+
+    Raises
+    ------
+    NWISEmptyResponse
+        If rdata holds no time-series data.
+    """
     dataframe = process_nwis_response(rdata)
-    if dataframe.empty is True:
-        print(f"Critical error!  Response status code: {response.status_code}\n No data found at: {url}")
-        raise SystemExit
+    if dataframe.empty:
+        raise NWISEmptyResponse(f"No data found at: {url}")
 
     nwisframe = NWISFrame(dataframe)
+    nwisframe._owns_values = True
     nwisframe._metadict = create_metadict(
         dataframe=nwisframe,
         STAID=STAID,
@@ -575,16 +824,107 @@ def get_nwis(
         rdata=rdata,
     )
 
-    if gap_fill and bool(gap_tol):
+    gaps_filled = gap_fill and bool(gap_tol)
+    if gaps_filled:
         nwisframe = nwisframe.fill_gaps(gap_tol)
+        # Nothing else holds the parsed columns the filled frame was built from.
+        nwisframe._owns_values = True
     if resolve_masking:
         nwisframe.resolve_masks()
-    nwisframe.check_quals()
-    nwisframe.check_approval()
-    nwisframe.check_gaps(gap_tol=gap_tol)
+    # Qualifiers and approval are only scanned when the qualifier/approval properties are read.
+    # A filled series has no gaps at gap_tol, only check unfilled data.
+    if not gaps_filled:
+        nwisframe.check_gaps(gap_tol=gap_tol)
     return nwisframe
 
 
+def get_nwis_many(
+    query_kwargs_list: list[dict],
+    max_workers: int = 8,
+    session: requests.Session | None = None,
+    errors: str = "raise",
+) -> list[NWISFrame | None]:
+    """Retreives NWIS time-series data for many stations or parameters concurrently.
+
+    Parameters
+    ----------
+    query_kwargs_list : list[dict]
+        One dict of get_nwis kwargs per query, e.g.
+        [{"STAID": "12301933", "start_date": "2023-01-03", "end_date": "2023-01-04", "param": "00060"}, ...]
+    max_workers : int, optional
+        Number of queries in flight at once, by default 8
+    session : requests.Session | None, optional
+        Session to query NWIS with, by default the shared module Session
+    errors : str, optional
+        "raise" - a failed query raises its NWISError and the remaining frames are lost.
+        "coerce" - a failed query leaves None in its place and the rest are still returned.
+        By default "raise"
+
+    Returns
+    -------
+    list[NWISFrame | None]
+        One NWISFrame per query, in the same order as query_kwargs_list.
+        None for queries that failed when errors="coerce".
+
+    Raises
+    ------
+    TypeError
+        If a query holds a key get_nwis does not take per query, e.g. "session",
+        or is missing a required one, e.g. "STAID".
+    ValueError
+        If a query's service is not "iv" or "dv".
+
+    Notes
+    -----
+    Every query is checked and its url built before any request is sent.
+    NWIS queries are network bound, so threads overlap the waiting on each response.
+    Only the requests run on the threads, each frame is built from its JSON as soon as
+    it arrives while the remaining requests are still in flight.
+    Keep max_workers at or below the Session's pool_maxsize so every thread gets a
+    pooled connection.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f'errors must be "raise" or "coerce", got {errors!r}')
+    # Check every query and build its url before any request is sent.
+    prepared = []
+    for i, kwargs in enumerate(query_kwargs_list):
+        unexpected = sorted(set(kwargs).difference(QUERY_KWARGS))
+        if unexpected:
+            raise TypeError(f"get_nwis_many query {i} got unexpected keyword arguments: {unexpected}")
+        frame_kwargs = dict(kwargs)
+        cache_ttl = frame_kwargs.pop("cache_ttl", None)
+        url = build_url(**{key: frame_kwargs[key] for key in URL_KWARGS if key in frame_kwargs})
+        prepared.append((url, cache_ttl, frame_kwargs))
+
+    queries = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for url, cache_ttl, frame_kwargs in prepared:
+            cache_key = _frame_cache_key(url, **frame_kwargs)
+            cached = memory_get(cache_key, cache_ttl) if cache_ttl else None
+            # Frames already built in this process are not queried again.
+            future = None if cached is not None else executor.submit(query_json, url, session=session, cache_ttl=cache_ttl)
+            queries.append((future, cached, cache_key, cache_ttl, url, frame_kwargs))
+
+        nwisframes = []
+        for future, cached, cache_key, cache_ttl, url, frame_kwargs in queries:
+            if cached is not None:
+                nwisframes.append(copy_nwisframe(cached))
+                continue
+            try:
+                nwisframe = build_nwisframe(future.result(), url=url, **frame_kwargs)
+            except NWISError:
+                if errors == "raise":
+                    # Leaving the with block waits for every queued request, drop the ones not started yet.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                nwisframes.append(None)
+                continue
+            if cache_ttl:
+                memory_put(cache_key, copy_nwisframe(nwisframe))
+            nwisframes.append(nwisframe)
+        return nwisframes
+
+
 if __name__ == "__main__":
     # Just some test data down here.
 
@@ -1,19 +1,404 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from urllib.parse import parse_qsl, urlsplit
+
+from typing import TYPE_CHECKING
+
+import numpy as np
 import pandas as pd
 import requests
-from dataclass_wizard import fromdict
-from nwisretrieval.schema_nwis_ts import NWISjson
+from requests.models import Response
+
+from nwisretrieval.exceptions import NWISError, NWISHTTPError, NWISNotFoundError, NWISRetrievalError
+from nwisretrieval.session import SESSION, TIMEOUT, decode_json
+
+if TYPE_CHECKING:
+    from nwisretrieval.schema_nwis_ts import NWISjson
+
+
+def __getattr__(name: str):
+    # The NWISjson schema pulls in dataclass_wizard, only import it when it is asked for.
+    # Keeps the helpers here cheap to import for inherit, register2 and caaqretrieval.
+    if name == "NWISjson":
+        from nwisretrieval.schema_nwis_ts import NWISjson
+
+        return NWISjson
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+NWIS_URL_TEMPLATES = {
+    "dv": "https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites={STAID}&startDT={start_date}&endDT={end_date}&statCd={stat_code}&parameterCd={param}&siteStatus=all&access={access}",
+    "iv": "https://nwis.waterservices.usgs.gov/nwis/iv/?format=json&sites={STAID}&parameterCd={param}&startDT={start_date}&endDT={end_date}&siteStatus=all&access={access}",
+}
+
+
+def get_requests_data(
+    service: str,
+    params: dict,
+    session: requests.Session | None = None,
+) -> dict:
+    """Query the NWIS service with params and decode the JSON response.
 
+    Parameters
+    ----------
+    service : str
+        "iv" or "dv"
+    params : dict
+        Query parameters, e.g. {"sites": "12323233", "parameterCd": "00060", ...}
+    session : requests.Session | None, optional
+        Session to query NWIS with, by default the shared module Session.
 
-def get_requests_data(service: str, params: dict) -> str:
+    Returns
+    -------
+    dict
+        Decoded JSON data.
+
+    Raises
+    ------
+    NWISNotFoundError
+        If NWIS has nothing for the query (status code 404).
+    NWISHTTPError
+        If status code is not 200, some error has occured and no data was returned.
+    NWISRetrievalError
+        If NWIS could not be reached, e.g. a timeout or retries were exhausted.
+    """
     base_urls = {
         "iv": "https://nwis.waterservices.usgs.gov/nwis/iv/",
         "dv": "https://nwis.waterservices.usgs.gov/nwis/dv/",
     }
-    return requests.get(url=base_urls[service], params=params).json()
+    session = session or SESSION
+    try:
+        response = session.get(url=base_urls[service], params=params, timeout=TIMEOUT)
+    except requests.RequestException as error:
+        raise NWISRetrievalError(f"Could not query: {base_urls[service]} {params}\n Reason: {error}") from error
+    return decode_json(check_response(response))
+
+
+def query_url(
+    url: str,
+    session: requests.Session | None = None,
+) -> Response:
+    """Query NWIS url with requests package.
+
+    Parameters
+    ----------
+    url : str
+        NWIS url pointing to JSON data
+    session : requests.Session | None, optional
+        Session to query NWIS with, by default the shared module Session
+        which keeps connections to NWIS alive between queries.
+
+    Returns
+    -------
+    Response
+        requests Response object
+
+    Raises
+    ------
+    NWISNotFoundError
+        If NWIS has nothing at url (status code 404).
+    NWISHTTPError
+        If status code is not 200, some error has occured and no data was returned.
+    NWISRetrievalError
+        If NWIS could not be reached, e.g. a timeout or retries were exhausted.
+    """
+    session = session or SESSION
+    try:
+        response = session.get(url, timeout=TIMEOUT)
+    except requests.RequestException as error:
+        raise NWISRetrievalError(f"Could not query: {url}\n Reason: {error}") from error
+    return check_response(response, url)
+
+
+def check_response(
+    response: Response,
+    url: str | None = None,
+) -> Response:
+    """Raise for an NWIS response that carries no data.
+
+    Parameters
+    ----------
+    response : Response
+        requests Response object
+    url : str | None, optional
+        Query url reported in the error, by default response.url
+
+    Returns
+    -------
+    Response
+        response, unchanged, when the status code is 200.
+
+    Raises
+    ------
+    NWISNotFoundError
+        If NWIS has nothing at url (status code 404).
+    NWISHTTPError
+        If status code is not 200, some error has occured and no data was returned.
+    """
+    url = url or response.url
+    if response.status_code == 404:
+        raise NWISNotFoundError(f"No data found at: {url}\n Reason: {response.reason}", response.status_code)
+    if response.status_code != 200:
+        raise NWISHTTPError(f"No data found at: {url}\n Reason: {response.reason}", response.status_code)
+    return response
+
+
+def get_records(
+    jdata: dict,
+    record_path: list,
+) -> list[dict]:
+    """Collect the records found at the end of record_path.
+    Lists encountered along the path are flattened, e.g. every timeSeries
+    contributes its values, the same as pd.json_normalize(record_path=...).
+
+    Parameters
+    ----------
+    jdata : dict
+        Decoded JSON data from NWIS url.
+    record_path : list
+        List of json keys to traverse to the records.
+
+    Returns
+    -------
+    list[dict]
+        Records at the end of record_path.
+    """
+    records = [jdata]
+    for key in record_path:
+        nested = [record[key] for record in records]
+        if len(nested) == 1 and isinstance(nested[0], list):
+            # Usually one timeSeries with one values block, index straight into it without copying.
+            records = nested[0]
+        else:
+            records = [item for value in nested for item in (value if isinstance(value, list) else [value])]
+    return records
+
+
+@lru_cache(maxsize=128)
+def _cached_expected_index(
+    start_date: str,
+    end_date: str,
+    gap_tol: str,
+) -> pd.DatetimeIndex:
+    """Cached index behind expected_index, never handed out directly."""
+    return pd.date_range(start_date, end_date, freq=gap_tol, name="dateTime")
+
+
+def expected_index(
+    start_date: str,
+    end_date: str,
+    gap_tol: str,
+) -> pd.DatetimeIndex:
+    """Complete "dateTime" index from start_date to end_date at a frequency of gap_tol.
+    Cached, frames pulled for the same period share the underlying timestamps.  Callers get
+    a view, so renaming the returned index (e.g. through .name) never reaches the cache.
+
+    Parameters
+    ----------
+    start_date : str
+        First timestamp of the range.
+    end_date : str
+        Last timestamp of the range.
+    gap_tol : str
+        Frequency string, e.g. "15min" or "D".
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        Every timestamp expected in a gap free series.
+    """
+    return _cached_expected_index(start_date, end_date, gap_tol).view()
+
+
+@lru_cache(maxsize=32)
+def gap_nanos(
+    gap_tol: str,
+) -> int:
+    """Length of one gap_tol step in nanoseconds.
+    Parsing a frequency alias costs more than the rest of a gap check on a short series,
+    and only a handful of gap tolerances are ever used, so each is parsed once.
+
+    Parameters
+    ----------
+    gap_tol : str
+        Fixed frequency string, e.g. "15min" or "D".
+
+    Returns
+    -------
+    int
+        Step in nanoseconds.
+
+    Raises
+    ------
+    ValueError
+        If gap_tol is not a fixed frequency, e.g. "M".
+    """
+    return pd.tseries.frequencies.to_offset(gap_tol).nanos
+
+
+def is_complete(
+    index: pd.DatetimeIndex,
+    start_date: str,
+    end_date: str,
+    gap_tol: str,
+) -> bool:
+    """Cheap check that index holds every expected timestamp, without building the expected index.
+    One vectorized pass over the int64 nanoseconds, no date_range and no set difference.
+
+    Parameters
+    ----------
+    index : pd.DatetimeIndex
+        Index of the time series to check.
+    start_date : str
+        First expected timestamp.
+    end_date : str
+        Last expected timestamp.
+    gap_tol : str
+        Frequency string, e.g. "15min" or "D".
+
+    Returns
+    -------
+    bool
+        True when index is unique, lies on the gap_tol grid between start_date and end_date
+        and has as many entries as that grid.  False means gaps are possible, not certain.
+        Only fixed frequencies (e.g. "15min", "D") can be counted, anything else returns False.
+        An empty index is never complete.
+    """
+    if len(index) == 0:
+        return False
+    try:
+        start = pd.Timestamp(start_date).value
+        end = pd.Timestamp(end_date).value
+        step = gap_nanos(gap_tol)
+    except (TypeError, ValueError):
+        return False
+    if (end - start) // step + 1 != len(index) or not index.is_unique:
+        return False
+    stamps = index.asi8
+    return bool(stamps.min() >= start and stamps.max() <= end and not ((stamps - start) % step).any())
+
+
+def parse_nwis_records(
+    jdata: dict,
+    record_path: list | None = None,
+    datetime_col: str = "dateTime",
+    value_col: str = "value",
+    dtype: str = "float32",
+    categorical: bool = True,
+) -> pd.DataFrame:
+    """Parse the time-series records in decoded NWIS JSON to pd.DataFrame.
+    Shared by every NWIS response parser in the package.
+
+    Parameters
+    ----------
+    jdata : dict
+        Decoded JSON data from NWIS url.
+    record_path : list | None, optional
+        List of json keys to traverse to the records.
+        By default ["value", "timeSeries", "values", "value"]
+    datetime_col : str, optional
+        Column containing datetime values to convert to DateTimeIndex.
+        By default "dateTime"
+    value_col : str, optional
+        Column containing retrieved data values to coerce to dtype.
+        By default "value"
+    dtype : str, optional
+        Float dtype of the value column, by default "float32"
+        NWIS reports values to a few significant digits, float32 holds ~7 and halves the column size.
+    categorical : bool, optional
+        Store qualifiers as categories of comma separated codes e.g. "P,Ice", by default True
+        If False, each row keeps its list of qualifier codes.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: value_col, "qualifiers"
+        Index: datetime_col - DateTimeIndex
+    """
+    if record_path is None:
+        record_path = ["value", "timeSeries", "values", "value"]
+    # The record schema is fixed, pull the records straight out of the decoded dict and
+    # fill preallocated columns in a single pass instead of normalizing one dict per row.
+    records = get_records(jdata, record_path)
+    n_records = len(records)
+    values = np.empty(n_records, dtype=dtype)
+    qualifiers = np.empty(n_records, dtype=object)
+    datetimes = np.empty(n_records, dtype=object)
+    for i, record in enumerate(records):
+        values[i] = float(record[value_col])
+        if categorical:
+            # Few distinct qualifier lists per series, stored once as categories.
+            qualifiers[i] = ",".join(record["qualifiers"]) or None
+        else:
+            qualifiers[i] = record["qualifiers"]
+        datetimes[i] = record[datetime_col][:23]
+
+    # NWIS datetimes are ISO 8601 local time, e.g. 2023-01-03T12:00:00.000-08:00 (iv)
+    # or 2023-01-03T00:00:00.000 (dv).  Dropping the UTC offset keeps local time.
+    # NumPy parses the remaining fixed-width ISO 8601 strings in C, no format matching.
+    return pd.DataFrame(
+        {
+            value_col: values,
+            "qualifiers": pd.Categorical(qualifiers) if categorical else qualifiers,
+        },
+        index=pd.DatetimeIndex(
+            datetimes.astype("datetime64[ns]"),
+            name=datetime_col,
+        ),
+    )
+
+
+def process_nwis_response(
+    jdata: dict,
+    record_path: list | None = None,
+    datetime_col: str = "dateTime",
+) -> tuple[pd.DataFrame, dict]:
+    """Process JSON data from NWIS to pd.DataFrame
+    Defaults are set for NWIS queries.
+
+    Parameters
+    ----------
+    jdata : dict
+        Decoded JSON data from requests Response from NWIS url.
+    record_path : list | None, optional
+        List of json keys to traverse to normalize values to DataFrame.
+        By default ["value", "timeSeries", "values", "value"]
+    datetime_col : str, optional
+        Column containing datetime values to convert to DateTimeIndex.
+        By default "dateTime"
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: "value" (float64), "qualifiers" (lists of qualifier codes)
+        Index: "dateTime" - DateTimeIndex
+    dict
+        The decoded JSON data, kept as the NWISFrame metadata.
+    """
+    dataframe = parse_nwis_records(
+        jdata,
+        record_path=record_path,
+        datetime_col=datetime_col,
+        dtype="float64",
+        categorical=False,
+    )
+    return dataframe, jdata
 
 
 class NWISFrame:
+    """NWIS time-series data and the metadata returned with it.
+
+    Notes
+    -----
+    All queries share a single module level requests Session (nwisretrieval.session.SESSION)
+    so TCP/TLS connections to NWIS are kept alive and reused between station pulls.
+    Pass session= to get_nwis to use your own Session instead.
+
+    meta is built once per query and never modified, so the metadata properties are
+    computed on first access and cached on the instance.
+    """
+
     def __init__(self, data, meta):
         self.ts = data
         self.meta = meta
@@ -21,86 +406,55 @@ class NWISFrame:
     def __repr__(self):
         return f"URL: {self.url}\n{self.ts}"
 
-    @property
-    def query_parameters(self):
-        url = self.url
-        params = url.split("?")[0].split("&")
-        split_params = [key_val.split("=") for key_val in params]
-        return {key_val[0]: key_val[1] for key_val in split_params}
+    @cached_property
+    def query_parameters(self) -> dict:
+        split_url = urlsplit(self.url)
+        # NWIS echoes the queryURL without a "?", the query is the last segment of the path.
+        query = split_url.query or split_url.path.rsplit("/", 1)[-1]
+        return dict(parse_qsl(query))
 
-    @property
+    @cached_property
     def url(self) -> str:
-        return self.meta.value.query_info.query_url
+        return self.meta["value"]["queryInfo"]["queryURL"]
 
-    @property
+    @cached_property
     def site_name(self) -> str:
-        return self.meta.value.time_series[0].source_info.site_name
+        return self.meta["value"]["timeSeries"][0]["sourceInfo"]["siteName"]
+
+    @cached_property
+    def schema(self) -> NWISjson:
+        """Typed NWISjson view of the response metadata.
+        Built on demand, the properties above index the raw JSON directly.
+        """
+        from dataclass_wizard import fromdict
+        from nwisretrieval.schema_nwis_ts import NWISjson
+
+        return fromdict(cls=NWISjson, d=self.meta)
 
     @staticmethod
     def process_nwis_response(
-        jdata: str,
+        jdata: dict,
         record_path: list | None = None,
         datetime_col: str = "dateTime",
-    ) -> pd.DataFrame:
-        """Process JSON data from NWIS to pd.DataFrame
-        Defaults are set for NWIS queries.
-
-        Parameters
-        ----------
-        jdata : str
-            JSON data string from requests Response from NWIS url.
-        record_path : list | None, optional
-            List of json keys to traverse to normalize values to DataFrame.
-            By default ["value", "timeSeries", "values", "value"]
-        datetime_col : str, optional
-            Column containing datetime values to convert to DateTimeIndex.
-            By default "dateTime"
-
-        Returns
-        -------
-        pd.DataFrame
-            Columns: "value", "qualifiers"
-            Index: "dateTime" - DateTimeIndex
-        """
-        if record_path is None:
-            record_path = [
-                "value",
-                "timeSeries",
-                "values",
-                "value",
-            ]
-
-        meta = fromdict(cls=NWISjson, d=jdata)
-
-        dataframe = pd.json_normalize(
-            jdata,
-            record_path=record_path,
-        )
-
-        dataframe[datetime_col] = pd.to_datetime(
-            dataframe[datetime_col].array,
-            infer_datetime_format=True,
-        )
-
-        dataframe.set_index(
-            datetime_col,
-            inplace=True,
-        )
-
-        dataframe = dataframe.tz_localize(None)
-        dataframe["value"] = pd.to_numeric(dataframe["value"])
-        return dataframe, meta
+    ) -> tuple[pd.DataFrame, dict]:
+        """Process JSON data from NWIS to pd.DataFrame, see process_nwis_response."""
+        return process_nwis_response(jdata, record_path=record_path, datetime_col=datetime_col)
 
     @classmethod
     def get_nwis(
         cls,
         service: str,
+        session: requests.Session | None = None,
         **kwargs,
     ) -> pd.DataFrame:
         """Get time series data from NWIS DV or IV service
 
         Parameters
         ----------
+        service : str
+            "iv" or "dv"
+        session : requests.Session | None, optional
+            Session to query NWIS with, by default the shared module Session.
         Common kwargs:
             format = json
             parameterCd = 00060 # discharge
@@ -116,10 +470,87 @@ class NWISFrame:
             Time-series data in the form of a pandas DataFrame
         """
 
-        json_data = get_requests_data(service=service, params=kwargs)
-        dataframe, meta = cls.process_nwis_response(json_data)
+        json_data = get_requests_data(service=service, params=kwargs, session=session)
+        return cls.from_json(json_data)
+
+    @classmethod
+    def from_json(
+        cls,
+        jdata: dict,
+    ) -> NWISFrame:
+        """Build an NWISFrame from NWIS JSON that has already been retrieved and decoded.
+
+        Parameters
+        ----------
+        jdata : dict
+            Decoded JSON data from an NWIS DV or IV query.
+
+        Returns
+        -------
+        NWISFrame
+        """
+        dataframe, meta = cls.process_nwis_response(jdata)
+        return cls(dataframe, meta)
+
+    @classmethod
+    def get_nwis_many(
+        cls,
+        station_kwargs_list: list[dict],
+        max_workers: int = 8,
+        session: requests.Session | None = None,
+        errors: str = "raise",
+    ) -> list[NWISFrame | None]:
+        """Get time series data for many stations concurrently.
+
+        Parameters
+        ----------
+        station_kwargs_list : list[dict]
+            One dict of get_nwis kwargs per query, e.g.
+            [{"service": "dv", "sites": "12323233", "parameterCd": "00060", ...}, ...]
+        max_workers : int, optional
+            Number of queries in flight at once, by default 8
+        session : requests.Session | None, optional
+            Session to query NWIS with, by default the shared module Session.
+        errors : str, optional
+            "raise" - a failed query raises its NWISError and the remaining frames are lost.
+            "coerce" - a failed query leaves None in its place and the rest are still returned.
+            By default "raise"
+
+        Returns
+        -------
+        list[NWISFrame | None]
+            One NWISFrame per query, in the same order as station_kwargs_list.
+            None for queries that failed when errors="coerce".
+
+        Notes
+        -----
+        NWIS queries are network bound, so threads overlap the waiting on each response.
+        Only the requests run on the threads, each frame is built from its JSON as soon as
+        it arrives while the remaining requests are still in flight.
+        Keep max_workers at or below the Session's pool_maxsize so every thread gets a
+        pooled connection.  More workers than NWIS is willing to serve concurrently
+        will not speed things up and may get requests throttled, be a good neighbor.
+        """
+        if errors not in ("raise", "coerce"):
+            raise ValueError(f'errors must be "raise" or "coerce", got {errors!r}')
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for kwargs in station_kwargs_list:
+                params = dict(kwargs)
+                service = params.pop("service")
+                futures.append(executor.submit(get_requests_data, service=service, params=params, session=session))
 
-        return NWISFrame(dataframe, meta)
+            nwisframes = []
+            for future in futures:
+                try:
+                    nwisframes.append(cls.from_json(future.result()))
+                except NWISError:
+                    if errors == "raise":
+                        # Leaving the with block waits for every queued request, drop the ones not started yet.
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                    nwisframes.append(None)
+            return nwisframes
 
 
 if __name__ == "__main__":
@@ -5,10 +5,11 @@ import warnings
 import numpy as np
 import pandas as pd
 import requests
-import sentinel
-from requests.models import Response
 
-Unknown = sentinel.create("Unknown")
+from nwisretrieval.exceptions import NWISEmptyResponse
+from nwisretrieval.nwis import NWIS_URL_TEMPLATES, expected_index, is_complete, parse_nwis_records, query_url
+from nwisretrieval.sentinels import Unknown
+from nwisretrieval.session import decode_json
 
 
 @pd.api.extensions.register_dataframe_accessor("nwis")
@@ -55,7 +56,9 @@ class NWISFrame:
     # Named properties in this list will propgate after dataframe manipulations e.g. slicing, asfreq, deepcopy(), etc.
     _metadata = ["_metadict", "STAID"]
 
-    # Custom sentinel object, works like "None"
+    # True only for DataFrames built by get_nwis, whose columns are not shared with any other
+    # DataFrame.  resolve_masks only writes into the value buffer in place when this is set.
+    _owns_values = False
 
     def __init__(self, pandas_obj):
         # self._obj._metadata._validate(pandas_obj)
@@ -152,11 +155,8 @@ class NWISFrame:
         Currently only checking for Ice qualifiers.
         May need to add more for equipment malfunctions, etc.
         """
-        mask = ~self._obj["qualifiers"].isnull()
-        unique_quals = list(pd.unique(self._obj["qualifiers"][mask].apply(frozenset)))
-        for qual in unique_quals:
-            if "Ice" in qual or "i" in qual:
-                return "Ice"
+        if self._qualifier_set() & {"Ice", "i"}:
+            return "Ice"
         return Unknown
 
     def check_gaps(
@@ -194,19 +194,20 @@ class NWISFrame:
         if gap_tol == Unknown:
             warnings.warn(f"\nNo gap tolerance specified for {self.staid}.", stacklevel=2)
             return Unknown
+        if is_complete(self._obj.index, self.start_date, self.end_date, gap_tol):
+            return False
         gap_index = self.gap_index(gap_tol).to_frame()
         if gap_index.index.empty:
             return False
         if start_date and end_date:
             if gap_index[start_date:end_date].empty:
                 return False
-            # This section is kinda getto, need to work on formatting warning message of missing dates.
+            missing = gap_index[start_date:end_date].index.to_numpy()
+            missing_dates = "\n".join(np.datetime_as_string(missing, unit="s"))
             warnings.warn(
-                f"\nGaps detected at: {self.staid} with a tolerance of {gap_tol} on:",
+                f"\nGaps detected at: {self.staid} with a tolerance of {gap_tol} on:\n{missing_dates}",
                 stacklevel=2,
             )
-            for missing_val in gap_index[start_date:end_date].index.array:
-                print(missing_val)
             return True
         warnings.warn(
             f"Gaps detected at: {self.staid} with a tolerance of {gap_tol}",
@@ -232,15 +233,21 @@ class NWISFrame:
         """
         gap_tol = self._resolve_gaptolerance(gap_tol)
         try:
-            idx = pd.date_range(self.start_date, self.end_date, freq=gap_tol)
-            return idx.difference(self._obj.index)
+            expected = expected_index(self.start_date, self.end_date, gap_tol)
+            index = self._obj.index
+            # Complete series, equals bails out on a length mismatch before comparing values.
+            if index.equals(expected):
+                return expected[:0]
+            # Both indexes are sorted datetimes, diff their int64 nanoseconds instead of Timestamps.
+            missing = np.setdiff1d(expected.asi8, index.asi8, assume_unique=index.is_unique)
+            return pd.DatetimeIndex(missing.view("datetime64[ns]"))
         except ValueError:
             return Unknown
 
     def fill_gaps(
         self,
         gap_tol: str | None = None,
-    ) -> NWISFrame:
+    ) -> pd.DataFrame:
         """Fill gaps in time-series data with NaN values.
 
         Parameters
@@ -250,20 +257,19 @@ class NWISFrame:
 
         Returns
         -------
-        NWISFrame
-            Return new instance of NWISFrame with gaps filled by NaN values
+        pd.DataFrame
+            New DataFrame with gaps filled by NaN values, its nwis accessor carries the metadata.
         """
-        gap_tol = self._obj._resolve_gaptolerance(gap_tol)
+        gap_tol = self._resolve_gaptolerance(gap_tol)
         try:
-            self = self._obj.reindex(pd.date_range(self.start_date, self.end_date, freq=gap_tol)).rename_axis(["dateTime"]).fillna(float("NaN"))
-            # self = self._obj._metadata.asfreq(freq=gap_tol)
-            self._obj._metadata._metadict["_gap_tolerance"] = gap_tol
-            # self["qualifiers"][self["qualifiers"].isnull()] = Unknown
-            # self["qualifier_set"] = self["qualifiers"].map(set)
-            return self
+            # A single reindex onto the full start/end range, missing rows come back as NaN.
+            filled = self._obj.reindex(expected_index(self.start_date, self.end_date, gap_tol))
         except ValueError:
             warnings.warn(f"No gap tolerance specified for {self.staid}.", stacklevel=2)
-            return self
+            return self._obj
+        # The accessor on the new DataFrame starts out empty, hand it this frame's metadata.
+        filled.nwis._metadata = {**self._metadata, "_gap_tolerance": gap_tol}
+        return filled
 
     def check_approval(self) -> str:
         """Checks approval level of data.
@@ -281,15 +287,16 @@ class NWISFrame:
         Notes
         -----
         """
-        mask = ~self._obj["qualifiers"].isnull()
-        unique_quals = list(pd.unique(self._obj["qualifiers"][mask].apply(frozenset)))
-        approval_level = next(
-            ("Provisional" for approval in unique_quals if "P" in approval),
-            "Approved",
-        )
+        approval_level = "Provisional" if "P" in self._qualifier_set() else "Approved"
         self._obj["_approval"] = approval_level
         return approval_level
 
+    def _qualifier_set(self) -> set:
+        """Every distinct qualifier code applied to the data.
+        One set union over the qualifier lists, no exploded Series is built.
+        """
+        return set().union(*self._obj["qualifiers"].dropna().to_numpy())
+
     def resolve_masks(self) -> None:
         """Convert any values from -999999 to NaN values.
         Set True to resolve NWIS masking of Ice qualified data to NaN values.
@@ -305,7 +312,13 @@ class NWISFrame:
         None
         """
 
-        self._obj["value"] = self._obj["value"].where(self._obj["value"] != -999999.0, np.NaN)
+        values = self._obj["value"].to_numpy(copy=False)
+        if self._owns_values and values.dtype.kind == "f":
+            # Write NaN straight into the float column, no new Series needed.
+            np.putmask(values, values == -999999.0, np.nan)
+        else:
+            # The column may be shared with the DataFrame this frame wraps or was sliced from.
+            self._obj["value"] = self._obj["value"].where(self._obj["value"] != -999999.0, np.NaN)
         return None
 
     def _resolve_gaptolerance(
@@ -322,34 +335,6 @@ class NWISFrame:
         return gap_tol
 
 
-def query_url(
-    url: str,
-) -> Response:
-    """Qurey NWIS url with requests package.
-
-    Parameters
-    ----------
-    url : str
-        NWIS url pointing to JSON data
-
-    Returns
-    -------
-    Response
-        requests Response object
-
-    Raises
-    ------
-    SystemExit
-        If status code is not 200, some error has occured and no data was
-        returned, exit the program.
-    """
-    response = requests.get(url)
-    if response.status_code != 200:
-        print(f"Critical error!  No data found at: {url}\n Reason: {response.reason}")
-        raise SystemExit
-    return response
-
-
 def create_metadict(
     rdata: dict | None = None,
     **kwargs,
@@ -369,7 +354,7 @@ def create_metadict(
     Notes
     -----
     Valid kwargs:
-        ""STAID"
+        "staid"
         "start_date"
         "end_date"
         "param"
@@ -383,31 +368,32 @@ def create_metadict(
         "_approval"
     """
     # Find all the valid kwargs, if a kwarg is not passed, return Unknown sentinetl
-    metadict = dict(
-        {
-            "_staid": kwargs.get("staid", Unknown),
-            "_start_date": kwargs.get("start_date", Unknown),
-            "_end_date": kwargs.get("end_date", Unknown),
-            "_param": kwargs.get("param", Unknown),
-            "_stat_code": kwargs.get("stat_code", Unknown),
-            "_service": kwargs.get("service", Unknown),
-            "_access_level": kwargs.get("access", Unknown),
-            "_url": kwargs.get("url", Unknown),
-            "_gap_tolerance": kwargs.get("gap_tol", Unknown),
-            "_gap_fill": kwargs.get("gap_fill", Unknown),
-            "_resolve_masking": kwargs.get("resolve_masking", Unknown),
-            "_approval": kwargs.get("_approval", Unknown),
-        }
-    )
+    metadict = {
+        "_staid": kwargs.get("staid", Unknown),
+        "_start_date": kwargs.get("start_date", Unknown),
+        "_end_date": kwargs.get("end_date", Unknown),
+        "_param": kwargs.get("param", Unknown),
+        "_stat_code": kwargs.get("stat_code", Unknown),
+        "_service": kwargs.get("service", Unknown),
+        "_access_level": kwargs.get("access", Unknown),
+        "_url": kwargs.get("url", Unknown),
+        "_gap_tolerance": kwargs.get("gap_tol", Unknown),
+        "_gap_fill": kwargs.get("gap_fill", Unknown),
+        "_resolve_masking": kwargs.get("resolve_masking", Unknown),
+        "_approval": kwargs.get("_approval", Unknown),
+    }
     if rdata:
+        # The NWIS schema is fixed, index straight to the first time series.
+        time_series = rdata["value"]["timeSeries"][0]
+        geog_location = time_series["sourceInfo"]["geoLocation"]["geogLocation"]
         metadict.update(
             {
-                "_site_name": rdata["value"]["timeSeries"][0]["sourceInfo"]["siteName"] or Unknown,
+                "_site_name": time_series["sourceInfo"]["siteName"] or Unknown,
                 "_coords": (
-                    rdata["value"]["timeSeries"][0]["sourceInfo"]["geoLocation"]["geogLocation"]["latitude"] or Unknown,
-                    rdata["value"]["timeSeries"][0]["sourceInfo"]["geoLocation"]["geogLocation"]["longitude"] or Unknown,
+                    geog_location["latitude"] or Unknown,
+                    geog_location["longitude"] or Unknown,
                 ),
-                "_var_description": rdata["value"]["timeSeries"][0]["variable"]["variableDescription"] or Unknown,
+                "_var_description": time_series["variable"]["variableDescription"] or Unknown,
             }
         )
     return metadict
@@ -440,24 +426,15 @@ def process_nwis_response(
     pd.DataFrame
         Columns: values, approval/qualifiers
         Index: DateTimeIndex
-
-    Raises
-    ------
-    SystemExit
-        If DataFrame returned from NWIS is empty, exit the program.
-        Why continue if there's no data?
+        Values are float32, cast with .astype("float64") if more precision is needed downstream.
     """
-    if record_path is None:
-        record_path = ["value", "timeSeries", "values", "value"]
-    dataframe = pd.json_normalize(rdata, record_path=record_path)
-    dataframe[datetime_col] = pd.to_datetime(
-        dataframe[datetime_col].array,
-        infer_datetime_format=True,
+    return parse_nwis_records(
+        rdata,
+        record_path=record_path,
+        datetime_col=datetime_col,
+        value_col=value_col,
+        categorical=False,
     )
-    dataframe.set_index(datetime_col, inplace=True)
-    dataframe = dataframe.tz_localize(None)
-    dataframe[value_col] = pd.to_numeric(dataframe[value_col])
-    return dataframe
 
 
 def build_url(
@@ -492,12 +469,23 @@ def build_url(
     -------
     str
         URL of data to query from NWIS.
+
+    Raises
+    ------
+    ValueError
+        If service is not "iv" or "dv".
     """
-    service_urls = {
-        "dv": f"https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites={STAID}&startDT={start_date}&endDT={end_date}&statCd={stat_code}&parameterCd={param}&siteStatus=all&access={access}",
-        "iv": f"https://nwis.waterservices.usgs.gov/nwis/iv/?format=json&sites={STAID}&parameterCd={param}&startDT={start_date}&endDT={end_date}&siteStatus=all&access={access}",
-    }
-    return service_urls[service]
+    if service not in NWIS_URL_TEMPLATES:
+        raise ValueError(f"service must be one of {list(NWIS_URL_TEMPLATES)}, got {service!r}")
+    # Only the requested service's template is formatted.
+    return NWIS_URL_TEMPLATES[service].format(
+        STAID=STAID,
+        start_date=start_date,
+        end_date=end_date,
+        param=param,
+        stat_code=stat_code,
+        access=access,
+    )
 
 
 def get_nwis(
@@ -511,6 +499,7 @@ def get_nwis(
     gap_tol: str | None = None,
     gap_fill: bool = False,
     resolve_masking: bool = False,
+    session: requests.Session | None = None,
 ) -> pd.DataFrame:
     """Retreives NWIS time-series data as a dataframe with
     extended methods and metadata properties.
@@ -542,6 +531,8 @@ def get_nwis(
         Data with qualifiers such as "Ice" will mask data values
         with -999999 when access level is public.
         Set True and -999999 will be converted to np.NaN values, by default False
+    session : requests.Session | None, optional
+        Session to query NWIS with, by default the shared module Session
 
     Returns
     -------
@@ -549,6 +540,13 @@ def get_nwis(
         Acts just like a pandas DataFrame, but comes with
         extended methods and properties.
 
+    Raises
+    ------
+    NWISRetrievalError
+        If the NWIS query fails.
+    NWISEmptyResponse
+        If the NWIS response holds no time-series data.
+
     Notes
     -----
     Refactor this function.  It handles too much.
@@ -563,17 +561,21 @@ def get_nwis(
         service=service,
         access=access,
     )
-    response = query_url(url)
-    rdata = response.json()
+    response = query_url(url, session=session)
+    rdata = decode_json(response)
+    # Only the decoded dict is needed from here on.  Release the raw body so it is not
+    # held alongside the decoded JSON and the new columns while the frame is built.
+    status_code = response.status_code
+    del response
     dataframe = process_nwis_response(rdata)
-    if dataframe.empty is True:
-        print(f"Critical error!  Response status code: {response.status_code}\n No data found at: {url}")
-        raise SystemExit
+    if dataframe.empty:
+        raise NWISEmptyResponse(f"Response status code: {status_code}\n No data found at: {url}")
 
     # dataframe = NWISFrame(dataframe)
+    dataframe.nwis._owns_values = True
     dataframe.nwis._metadata = create_metadict(
         dataframe=dataframe,
-        STAID=staid,
+        staid=staid,
         start_date=start_date,
         end_date=end_date,
         param=param,
@@ -587,13 +589,17 @@ def get_nwis(
         rdata=rdata,
     )
 
-    if gap_fill and bool(gap_tol):
+    gaps_filled = gap_fill and bool(gap_tol)
+    if gaps_filled:
         dataframe = dataframe.nwis.fill_gaps(gap_tol)
+        # Nothing else holds the parsed columns the filled frame was built from.
+        dataframe.nwis._owns_values = True
     if resolve_masking:
         dataframe.nwis.resolve_masks()
-    dataframe.nwis.check_quals()
-    dataframe.nwis.check_approval()
-    dataframe.nwis.check_gaps(gap_tol=gap_tol)
+    # Qualifiers and approval are only scanned when the qualifier/approval properties are read.
+    # A filled series has no gaps at gap_tol, only check unfilled data.
+    if not gaps_filled:
+        dataframe.nwis.check_gaps(gap_tol=gap_tol)
     return dataframe
 
 
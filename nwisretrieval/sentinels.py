@@ -0,0 +1,6 @@
+import sentinel
+
+# Custom sentinel object, works like "None" but reads as "Unknown".
+# Created once and shared by every module: sentinel.create inspects the call stack, which is
+# slow at import time, and a module level name is what lets frames holding it be pickled.
+Unknown = sentinel.create("Unknown")
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+from nwisretrieval.exceptions import NWISRetrievalError
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back on requests' stdlib json decoding.
+    orjson = None
+
+# (connect, read) timeout in seconds passed to every NWIS request.
+TIMEOUT = (5, 60)
+
+
+def create_session(
+    pool_connections: int = 16,
+    pool_maxsize: int = 32,
+) -> requests.Session:
+    """Create a requests Session with a pooled, retrying HTTPS adapter.
+
+    Parameters
+    ----------
+    pool_connections : int, optional
+        Number of host connection pools to cache, by default 16
+    pool_maxsize : int, optional
+        Maximum number of connections kept alive per host, by default 32
+
+    Returns
+    -------
+    requests.Session
+        Session that reuses TCP/TLS connections across NWIS queries.
+    """
+    session = requests.Session()
+    # NWIS JSON compresses well, always ask for it compressed.  urllib3's ACCEPT_ENCODING
+    # adds br (and zstd) only when a decoder for them is installed, e.g. the brotli package.
+    session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "Accept": "application/json"})
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            # 429 is NWIS throttling, Retry waits out its Retry-After header before trying again.
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Single shared session per process.  Keep-alive connections to
+# waterservices.usgs.gov are reused by every query made through this module.
+SESSION = create_session()
+
+
+def decode_json(
+    response: requests.Response,
+) -> dict:
+    """Decode the JSON body of a requests Response.
+    Uses orjson straight from the response bytes when it is installed,
+    otherwise falls back on Response.json().
+
+    Parameters
+    ----------
+    response : requests.Response
+        Response from an NWIS query.
+
+    Returns
+    -------
+    dict
+        Decoded JSON data.
+
+    Raises
+    ------
+    NWISRetrievalError
+        If the body is not JSON, e.g. an HTML maintenance page served with status 200.
+    """
+    try:
+        if orjson is None:
+            return response.json()
+        return orjson.loads(response.content)
+    except ValueError as error:
+        # orjson, json and requests decode errors all subclass ValueError.
+        raise NWISRetrievalError(f"Could not decode JSON from: {response.url}\n Reason: {error}") from error
+
+
+def loads(
+    content: bytes,
+) -> dict:
+    """Decode a JSON response body, e.g. one read back from the response cache.
+    Uses orjson when it is installed, otherwise the standard library json.
+
+    Parameters
+    ----------
+    content : bytes
+        Raw JSON response body.
+
+    Returns
+    -------
+    dict
+        Decoded JSON data.
+    """
+    if orjson is None:
+        return json.loads(content)
+    return orjson.loads(content)
@@ -1,11 +1,26 @@
+import io
 import warnings
 
 import pandas as pd
+import requests
+from nwisretrieval.session import SESSION, TIMEOUT
 
 # url = "https://www.waterqualitydata.us/data/Result/search?siteid=USGS-433615110440001&startDateLo=10-01-2020&startDateHi=10-01-2023&pCode=00400&mimeType=csv"
 # data = pd.read_csv(url)
 # pause = 2
 
+QWP_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# QWP result columns kept by get_qwp and the names they are renamed to.
+QWP_RESULT_COLUMNS = {
+    "MonitoringLocationIdentifier": "staid",
+    "CharacteristicName": "param_name",
+    "ResultMeasureValue": "value",
+    "ResultMeasure/MeasureUnitCode": "units",
+    "ResultDetectionConditionText": "detection_condition",
+    "USGSPCode": "pcode",
+}
+
 
 def _get_base_url(service: str) -> str:
     """Get the base url for the selected QWP service.
@@ -122,7 +137,7 @@ def _construct_url(service: str, **kwargs) -> str:
 
 
 def _set_datetime_index(dataframe: pd.DataFrame) -> None:
-    """Combine date and time columns to a DateTimeIndex.  Operates in place.
+    """Combine date and time columns to a DateTimeIndex and drop them.  Operates in place.
 
     Parameters
     ----------
@@ -134,14 +149,15 @@ def _set_datetime_index(dataframe: pd.DataFrame) -> None:
     None
         Operates on dataframe in place, no return value.
     """
-    dataframe["dateTime"] = (
-        dataframe["ActivityStartDate"] + " " + dataframe["ActivityStartTime/Time"]
-    )
-    dataframe["dateTime"] = pd.to_datetime(
-        dataframe["dateTime"].array,
-        infer_datetime_format=True,
+    # QWP dates and times are always e.g. 2020-10-01 and 10:30:00, skip format inference.
+    # pop the source columns, they are not needed once the index is built.
+    dataframe.index = pd.DatetimeIndex(
+        pd.to_datetime(
+            (dataframe.pop("ActivityStartDate") + " " + dataframe.pop("ActivityStartTime/Time")).array,
+            format=QWP_DATETIME_FORMAT,
+        ),
+        name="dateTime",
     )
-    dataframe.set_index("dateTime", inplace=True)
     return None
 
 
@@ -149,6 +165,7 @@ def get_qwp(
     staid: str | int,
     startDateLo: str,
     service: str,
+    session: requests.Session | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """Query the QWP and return a pandas DataFrame.
@@ -173,7 +190,9 @@ def get_qwp(
         "activity metric"
         "biological metric"
         "project weighting"
-
+    session : requests.Session | None, optional
+        Session to query QWP with, by default the shared nwisretrieval Session
+        which keeps connections alive between queries.
     **kwargs :  Optional keyword arguments
         Useful arguments:
             startDateHi : str
@@ -200,8 +219,17 @@ def get_qwp(
         service=service,
         **kwargs,
     )
+    session = session or SESSION
+    # The shared Session asks for JSON by default, QWP is queried for csv.
+    response = session.get(url, headers={"Accept": "text/csv"}, timeout=TIMEOUT)
+    response.raise_for_status()
+    # Only parse the columns that are kept, QWP results carry dozens more.
     # USGS has leading '0's in pCodes. Treat them as strings to avoid dropping them.
-    dataframe = pd.read_csv(url, dtype={"USGSPCode": str})
+    dataframe = pd.read_csv(
+        io.BytesIO(response.content),
+        usecols=[*QWP_RESULT_COLUMNS, "ActivityStartDate", "ActivityStartTime/Time"],
+        dtype={"USGSPCode": str, "ActivityStartDate": str, "ActivityStartTime/Time": str},
+    )
     if dataframe.empty is True:
         warnings.warn(f"\nNo data for station {staid} at:\n{url}", stacklevel=2)
     # Combine date and time columns and form dateTime index.
@@ -211,28 +239,8 @@ def get_qwp(
         "MonitoringLocationIdentifier"
     ].str.slice(5)
     # Remove excessive columns and rename.
-    dataframe = dataframe.loc[
-        :,
-        [
-            "MonitoringLocationIdentifier",
-            "CharacteristicName",
-            "ResultMeasureValue",
-            "ResultMeasure/MeasureUnitCode",
-            "ResultDetectionConditionText",
-            "USGSPCode",
-        ],
-    ]
-    dataframe.rename(
-        columns={
-            "MonitoringLocationIdentifier": "staid",
-            "CharacteristicName": "param_name",
-            "ResultMeasureValue": "value",
-            "ResultMeasure/MeasureUnitCode": "units",
-            "ResultDetectionConditionText": "detection_condition",
-            "USGSPCode": "pcode",
-        },
-        inplace=True,
-    )
+    dataframe = dataframe.loc[:, list(QWP_RESULT_COLUMNS)]
+    dataframe.rename(columns=QWP_RESULT_COLUMNS, inplace=True)
     return dataframe
 
 
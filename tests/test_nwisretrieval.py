@@ -8,7 +8,10 @@ import pytest
 from rich import print
 
 from dataclass_wizard import fromdict
-from nwisretrieval.nwis import NWISjson, NWISFrame
+from nwisretrieval.exceptions import NWISEmptyResponse, NWISNotFoundError, NWISRetrievalError
+from nwisretrieval import inherit
+from nwisretrieval.inherit import query_json, query_url
+from nwisretrieval.nwis import NWISjson, NWISFrame, expected_index, is_complete
 
 
 @pytest.fixture
@@ -169,6 +172,21 @@ def test_fill_gaps(dummy_station_ice_provisional_1Day_gap):
     assert all(dummy_station_ice_provisional_1Day_gap.index == expected_index)
 
 
+def test_fill_gaps_leaves_source_metadata():
+    index = pd.DatetimeIndex(["2023-01-01", "2023-01-03"], name="dateTime")
+    source = inherit.NWISFrame({"value": [1.0, 3.0], "qualifiers": ["A", "A"]}, index=index)
+    source._metadict = inherit.create_metadict(STAID="12340500", start_date="2023-01-01", end_date="2023-01-03")
+    filled = source.fill_gaps("D")
+    assert len(filled) == 3
+    assert filled.gap_tolerance == "D"
+    assert source._metadict["_gap_tolerance"] is inherit.NWISFrame.Unknown
+    # No gaps at 2D, the early return must not touch the source either.
+    complete = source.fill_gaps("2D")
+    assert complete is not source
+    assert complete.gap_tolerance == "2D"
+    assert source._metadict["_gap_tolerance"] is inherit.NWISFrame.Unknown
+
+
 def test_check_quals(dummy_station_ice_provisional_1Day_gap):
     assert dummy_station_ice_provisional_1Day_gap.qualifier == "Ice"
 
@@ -282,6 +300,406 @@ def test_experiment(requests_json_return_data):
     pause = 2
 
 
+def test_process_nwis_response(requests_json_return_data):
+    ts_data, _ = NWISFrame.process_nwis_response(requests_json_return_data)
+    assert len(ts_data) == 32
+    assert list(ts_data.columns) == ["value", "qualifiers"]
+    assert ts_data["value"].dtype == np.float64
+    assert ts_data.index.name == "dateTime"
+    assert ts_data.index[0] == pd.Timestamp("2022-07-01")
+    assert ts_data["value"].iloc[0] == 4.77
+    assert ts_data["qualifiers"].iloc[0] == ["A"]
+
+
+def test_process_nwis_response_iv_offsets():
+    # IV datetimes carry a UTC offset, parsing keeps local wall time as a naive index.
+    values = [
+        {"value": "1.5", "qualifiers": ["P"], "dateTime": "2023-03-12T01:45:00.000-07:00"},
+        {"value": "1.6", "qualifiers": ["P"], "dateTime": "2023-03-12T03:00:00.000-06:00"},
+    ]
+    jdata = {"value": {"timeSeries": [{"values": [{"value": values}]}]}}
+    ts_data, _ = NWISFrame.process_nwis_response(jdata)
+    assert ts_data.index.tz is None
+    assert list(ts_data.index) == [pd.Timestamp("2023-03-12 01:45"), pd.Timestamp("2023-03-12 03:00")]
+
+
+def test_nwisframe_meta(requests_json_return_data):
+    data = NWISFrame(*NWISFrame.process_nwis_response(requests_json_return_data))
+    assert data.url == requests_json_return_data["value"]["queryInfo"]["queryURL"]
+    assert data.site_name == "Blacktail Creek above Grove Gulch, at Butte, MT"
+    assert isinstance(data.schema, NWISjson)
+
+
+def test_from_json(requests_json_return_data):
+    data = NWISFrame.from_json(requests_json_return_data)
+    assert isinstance(data, NWISFrame)
+    assert len(data.ts) == 32
+    assert data.meta is requests_json_return_data
+
+
+def test_query_parameters(requests_json_return_data):
+    data = NWISFrame(*NWISFrame.process_nwis_response(requests_json_return_data))
+    assert data.query_parameters == {
+        "format": "json",
+        "sites": "12323233",
+        "startDT": "2022-07-01",
+        "endDT": "2022-08-01",
+        "statCd": "00003",
+        "parameterCd": "00060",
+    }
+
+
+def test_get_nwis_many(monkeypatch, requests_json_return_data):
+    monkeypatch.setattr(
+        "nwisretrieval.nwis.get_requests_data",
+        lambda service, params, session=None: requests_json_return_data,
+    )
+    station_kwargs = [{"service": "dv", "sites": staid} for staid in ("12340500", "12323233")]
+    frames = NWISFrame.get_nwis_many(station_kwargs, max_workers=2)
+    assert len(frames) == 2
+    assert all(isinstance(frame, NWISFrame) for frame in frames)
+
+
+def test_get_nwis_many_errors(monkeypatch, requests_json_return_data):
+    class NotFound:
+        status_code = 404
+        reason = "Not Found"
+        url = "https://nwis.waterservices.usgs.gov/nwis/dv/?sites=0"
+
+    class Session:
+        def get(self, url, params, timeout):
+            if params["sites"] == "0":
+                return NotFound()
+            raise AssertionError("only the missing site is queried here")
+
+    with pytest.raises(NWISNotFoundError):
+        NWISFrame.get_nwis_many([{"service": "dv", "sites": "0"}], session=Session())
+
+    def get_requests_data(service, params, session=None):
+        if params["sites"] == "0":
+            raise NWISNotFoundError("No data found", 404)
+        return requests_json_return_data
+
+    monkeypatch.setattr("nwisretrieval.nwis.get_requests_data", get_requests_data)
+    station_kwargs = [{"service": "dv", "sites": staid} for staid in ("12340500", "0")]
+    frames = NWISFrame.get_nwis_many(station_kwargs, errors="coerce")
+    assert isinstance(frames[0], NWISFrame)
+    assert frames[1] is None
+
+
+def test_inherit_get_nwis_many(monkeypatch, requests_json_return_data):
+    urls = []
+
+    def query_json(url, session=None, cache_ttl=None):
+        urls.append(url)
+        return requests_json_return_data
+
+    monkeypatch.setattr("nwisretrieval.inherit.query_json", query_json)
+    query_kwargs = [
+        {"STAID": staid, "start_date": "2023-01-01", "end_date": "2023-04-01", "param": "00060", "service": "dv"}
+        for staid in ("12340500", "12323233")
+    ]
+    frames = inherit.get_nwis_many(query_kwargs, max_workers=2)
+    assert [frame.STAID for frame in frames] == ["12340500", "12323233"]
+    assert [frame.url for frame in frames] == urls
+
+
+def test_inherit_get_nwis_many_coerce(monkeypatch, requests_json_return_data):
+    def query_json(url, session=None, cache_ttl=None):
+        if "sites=0&" in url:
+            raise NWISEmptyResponse(f"No data found at: {url}")
+        return requests_json_return_data
+
+    monkeypatch.setattr("nwisretrieval.inherit.query_json", query_json)
+    query_kwargs = [
+        {"STAID": staid, "start_date": "2023-01-01", "end_date": "2023-04-01", "param": "00060", "service": "dv"}
+        for staid in ("12340500", "0")
+    ]
+    with pytest.raises(NWISEmptyResponse):
+        inherit.get_nwis_many(query_kwargs)
+    frames = inherit.get_nwis_many(query_kwargs, errors="coerce")
+    assert frames[0].STAID == "12340500"
+    assert frames[1] is None
+
+
+def test_inherit_get_nwis_many_undecodable(requests_json_return_data):
+    import time
+
+    calls = []
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, url, content):
+            self.url = url
+            self.content = content
+
+        def json(self):
+            return json.loads(self.content)
+
+    class Session:
+        def get(self, url, timeout):
+            staid = url.split("sites=")[1].split("&")[0]
+            calls.append(staid)
+            if staid == "0":
+                return Response(url, b"<html>maintenance</html>")
+            time.sleep(0.2)
+            return Response(url, json.dumps(requests_json_return_data).encode())
+
+    query_kwargs = [
+        {"STAID": staid, "start_date": "2023-01-01", "end_date": "2023-04-01", "param": "00060", "service": "dv"}
+        for staid in ("0", "1", "2", "3")
+    ]
+    frames = inherit.get_nwis_many(query_kwargs[:2], session=Session(), errors="coerce")
+    assert frames[0] is None
+    assert frames[1].STAID == "1"
+    # A failed query with errors="raise" cancels the queries that have not started yet.
+    calls.clear()
+    with pytest.raises(NWISRetrievalError):
+        inherit.get_nwis_many(query_kwargs, max_workers=1, session=Session())
+    assert "3" not in calls
+
+
+def test_inherit_get_nwis_many_unexpected_kwargs(monkeypatch):
+    urls = []
+    monkeypatch.setattr("nwisretrieval.inherit.query_json", lambda url, session=None, cache_ttl=None: urls.append(url))
+    query_kwargs = [
+        {"STAID": "12340500", "start_date": "2023-01-01", "end_date": "2023-04-01", "param": "00060"},
+        {"STAID": "12323233", "start_date": "2023-01-01", "end_date": "2023-04-01", "param": "00060", "session": None},
+    ]
+    with pytest.raises(TypeError, match="session"):
+        inherit.get_nwis_many(query_kwargs)
+    # A missing required key or a bad service is caught before the first query is sent too.
+    del query_kwargs[1]["session"], query_kwargs[1]["STAID"]
+    with pytest.raises(TypeError):
+        inherit.get_nwis_many(query_kwargs)
+    query_kwargs[1].update(STAID="12323233", service="xx")
+    with pytest.raises(ValueError):
+        inherit.get_nwis_many(query_kwargs)
+    assert urls == []
+
+
+def test_get_nwis_memory_cache(monkeypatch, requests_json_return_data):
+    from nwisretrieval.cache import clear_cache
+
+    calls = []
+
+    def query_json(url, session=None, cache_ttl=None):
+        calls.append(url)
+        return requests_json_return_data
+
+    monkeypatch.setattr("nwisretrieval.inherit.query_json", query_json)
+    clear_cache()
+    query = {"STAID": "12340500", "start_date": "2023-01-01", "end_date": "2023-04-01", "param": "00060", "service": "dv"}
+    first = inherit.get_nwis(**query, cache_ttl=60)
+    second = inherit.get_nwis(**query, cache_ttl=60)
+    assert len(calls) == 1
+    pd_testing.assert_frame_equal(first, second)
+    # Each call gets its own copy, modifying one does not reach the cache.
+    second["value"] = np.nan
+    second._metadict["_STAID"] = "0"
+    third = inherit.get_nwis(**query, cache_ttl=60)
+    pd_testing.assert_frame_equal(first, third)
+    assert third.STAID == "12340500"
+    clear_cache()
+
+
+def test_register2_fill_gaps():
+    from nwisretrieval import register2
+
+    dataframe = pd.DataFrame(
+        {"value": [1.0, 3.0], "qualifiers": [["A"], ["A"]]},
+        index=pd.DatetimeIndex(["2023-01-01", "2023-01-03"], name="dateTime"),
+    )
+    dataframe.nwis._metadata = register2.create_metadict(staid="12340500", start_date="2023-01-01", end_date="2023-01-03")
+    filled = dataframe.nwis.fill_gaps("D")
+    assert len(filled) == 3
+    assert len(dataframe) == 2
+    assert filled.nwis.staid == "12340500"
+    assert filled.nwis.gap_tolerance == "D"
+
+
+def test_expected_index_rename_leaves_cache():
+    index = expected_index("2023-01-01", "2023-01-03", "D")
+    index.name = "renamed"
+    assert expected_index("2023-01-01", "2023-01-03", "D").name == "dateTime"
+
+
+def test_qual_cache_readonly():
+    from caaqretrieval.caaqretrieval import CAAQFrame
+
+    for frame_class in (inherit.NWISFrame, CAAQFrame):
+        data = frame_class({"value": [1.0], "qualifiers": [["P", "Ice"]]})
+        assert data.approval == "Provisional"
+        with pytest.raises(AttributeError):
+            data._qual_cache = frozenset()
+
+
+def test_get_qwp():
+    import requests
+    from qwpretrieval.qwpretreival import get_qwp
+
+    content = (
+        b"MonitoringLocationIdentifier,ActivityStartDate,ActivityStartTime/Time,CharacteristicName,"
+        b"ResultMeasureValue,ResultMeasure/MeasureUnitCode,ResultDetectionConditionText,USGSPCode,ProviderName\n"
+        b"USGS-433615110440001,2020-10-01,10:30:00,pH,7.9,std units,,00400,NWIS\n"
+        b"USGS-433615110440001,2021-04-12,09:15:00,pH,8.1,std units,,00400,NWIS\n"
+    )
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, content):
+            self.content = content
+
+        def raise_for_status(self):
+            if self.status_code != 200:
+                raise requests.HTTPError(f"{self.status_code} Server Error")
+
+    class Session:
+        headers = []
+
+        def __init__(self, response):
+            self.response = response
+
+        def get(self, url, headers, timeout):
+            Session.headers.append(headers)
+            return self.response
+
+    data = get_qwp(staid="433615110440001", startDateLo="10-01-2020", service="results", session=Session(Response(content)))
+    assert Session.headers == [{"Accept": "text/csv"}]
+    assert list(data.columns) == ["staid", "param_name", "value", "units", "detection_condition", "pcode"]
+    expected_index = pd.DatetimeIndex(["2020-10-01 10:30:00", "2021-04-12 09:15:00"], name="dateTime")
+    pd_testing.assert_index_equal(data.index, expected_index)
+    assert data["staid"].tolist() == ["433615110440001", "433615110440001"]
+    # pCodes keep their leading zeros.
+    assert data["pcode"].tolist() == ["00400", "00400"]
+
+    error = Response(b"")
+    error.status_code = 500
+    with pytest.raises(requests.HTTPError):
+        get_qwp(staid="433615110440001", startDateLo="10-01-2020", service="results", session=Session(error))
+
+
+def test_is_complete():
+    index = pd.date_range("2023-01-03", "2023-01-04", freq="15min")
+    assert is_complete(index, "2023-01-03", "2023-01-04", "15min")
+    assert not is_complete(index.delete(5), "2023-01-03", "2023-01-04", "15min")
+    # Same length, but one timestamp is off the 15 minute grid.
+    shifted = index.delete(5).insert(5, index[5] + pd.Timedelta("1min"))
+    assert not is_complete(shifted, "2023-01-03", "2023-01-04", "15min")
+    # end before start expects no timestamps, an empty index still is not complete.
+    assert not is_complete(index[:0], "2023-01-04", "2023-01-03", "15min")
+
+
+def test_resolve_masks_in_place():
+    values = np.array([1.5, -999999.0, 2.5], dtype="float32")
+    data = inherit.NWISFrame(pd.DataFrame({"value": values, "qualifiers": ["A", "Ice", "A"]}))
+    # Frames built by get_nwis own their columns.
+    data._owns_values = True
+    buffer = data["value"].to_numpy()
+    data.resolve_masks()
+    assert np.isnan(data["value"].iloc[1])
+    assert data["value"].dtype == np.float32
+    # Masks are written into the existing column, not a new one.
+    assert np.isnan(buffer[1])
+
+
+def test_resolve_masks_leaves_source_untouched():
+    source = pd.DataFrame({"value": np.array([1.5, -999999.0], dtype="float32"), "qualifiers": ["A", "Ice"]})
+    data = inherit.NWISFrame(source)
+    data.resolve_masks()
+    assert np.isnan(data["value"].iloc[1])
+    assert data["value"].dtype == np.float32
+    # A wrapped DataFrame shares its columns, it must not be masked along with the NWISFrame.
+    assert source["value"].iloc[1] == -999999.0
+    parent = inherit.NWISFrame(pd.DataFrame({"value": [-999999.0, 2.0], "qualifiers": ["Ice", "A"]}))
+    # Nor a frame it was sliced from.
+    assert parent.approval == "Approved"
+    parent.iloc[:1].resolve_masks()
+    assert parent["value"].iloc[0] == -999999.0
+    # Nor the approval the parent already worked out, the slice shares its _metadict.
+    assert parent._metadict["_approval"] == "Approved"
+
+
+def test_query_url_error():
+    class NotFound:
+        status_code = 404
+        reason = "Not Found"
+
+    class Session:
+        def get(self, url, timeout):
+            return NotFound()
+
+    with pytest.raises(NWISRetrievalError):
+        query_url("https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites=0", session=Session())
+    with pytest.raises(NWISNotFoundError):
+        query_url("https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites=0", session=Session())
+
+
+def test_build_url_service():
+    url = inherit.build_url("12340500", "2023-01-01", "2023-04-01", "00060", service="dv")
+    assert url.startswith("https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites=12340500&")
+    with pytest.raises(ValueError):
+        inherit.build_url("12340500", "2023-01-01", "2023-04-01", "00060", service="gw")
+
+
+def test_query_json_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr("nwisretrieval.cache.CACHE_DIR", tmp_path)
+    url = "https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites=12340500"
+
+    class OK:
+        status_code = 200
+        content = b'{"value": 1}'
+
+        def json(self):
+            return json.loads(self.content)
+
+    class Session:
+        calls = 0
+
+        def get(self, url, timeout):
+            Session.calls += 1
+            return OK()
+
+    assert query_json(url, session=Session(), cache_ttl=60) == {"value": 1}
+    # Second query is answered from the cache, NWIS is not queried again.
+    assert query_json(url, session=Session(), cache_ttl=60) == {"value": 1}
+    assert Session.calls == 1
+    # Without cache_ttl the cache is bypassed.
+    query_json(url, session=Session())
+    assert Session.calls == 2
+
+
+def test_query_json_cache_undecodable(monkeypatch, tmp_path):
+    from nwisretrieval.cache import cache_path, write_cache
+
+    monkeypatch.setattr("nwisretrieval.cache.CACHE_DIR", tmp_path)
+    url = "https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites=12340500"
+
+    class Response:
+        status_code = 200
+        content = b"<html>maintenance</html>"
+        url = "https://nwis.waterservices.usgs.gov/nwis/dv/?format=json&sites=12340500"
+
+        def json(self):
+            return json.loads(self.content)
+
+    class Session:
+        def get(self, url, timeout):
+            return Response()
+
+    # A 200 response that is not JSON is never written to the cache.
+    with pytest.raises(NWISRetrievalError):
+        query_json(url, session=Session(), cache_ttl=60)
+    assert not cache_path(url).exists()
+    # An undecodable cache file is a miss, NWIS is queried again and the file replaced.
+    write_cache(url, b"<html>maintenance</html>")
+    Response.content = b'{"value": 1}'
+    assert query_json(url, session=Session(), cache_ttl=60) == {"value": 1}
+    assert query_json(url, session=Session(), cache_ttl=60) == {"value": 1}
+
+
 if __name__ == "__main__":
     with open(
         "tests/test_data/get_nwis_site=12340500_service=dv_parameterCd=00060_startDT=20230101_endDt=20230401_format=json.json",